@@ -0,0 +1,80 @@
+"""
+Shared logic for setup_check.py and setup_verification.py.
+
+The checks here only gather facts and return them; each script keeps its
+own presentation (colored ✓/✗ lines vs. emoji status lines).
+"""
+
+import importlib.util
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Values that mean "not configured": empty, or left as the .env.example placeholder
+PLACEHOLDER_VALUES = frozenset({"", "your-key-here", "your-resource-name", "your-fmp-api-key-here"})
+
+ENV_FILE = Path(".env")
+
+@cache
+def path_for(name: str) -> Path:
+    """Path object for name, built once; only the Path is cached, never stat results."""
+    return Path(name)
+
+@cache
+def ensure_env() -> bool:
+    """Load .env once per run; without python-dotenv the process environment is used as-is."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+    load_dotenv()
+    return True
+
+# The interpreter version cannot change within a process, so it is evaluated once
+_PY_VER = sys.version_info
+_PY_OK = _PY_VER >= (3, 10)
+_PY_VER_STR = "%d.%d.%d" % _PY_VER[:3]
+
+def python_version() -> Tuple[bool, str]:
+    """Return whether the interpreter is 3.10+ and its major.minor.micro string."""
+    return _PY_OK, _PY_VER_STR
+
+def find_packages(module_names: Iterable[str]) -> List[bool]:
+    """
+    Report whether each module is importable, in input order.
+
+    find_spec locates each package without running its import-time code; the
+    probes only touch the filesystem, so they run in parallel threads.
+    """
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        return [spec is not None for spec in ex.map(importlib.util.find_spec, module_names)]
+
+def env_value(var: str) -> Optional[str]:
+    """Return the stripped value of var, or None if it is unset or a placeholder."""
+    value = os.environ.get(var, "").strip()
+    return None if value in PLACEHOLDER_VALUES else value
+
+def cwd_entries() -> Set[str]:
+    """Names in the working directory, listed once instead of a stat per name."""
+    return set(os.listdir("."))
+
+def ensure_directories(names: Iterable[str]) -> Dict[str, Tuple[str, Optional[Exception]]]:
+    """
+    Create any missing storage directories.
+
+    Maps each name to ("exists" | "created" | "failed", error).
+    """
+    outcome: Dict[str, Tuple[str, Optional[Exception]]] = {}
+    for name in names:
+        # mkdir alone answers "did it exist?" in one syscall, with no stat-then-create gap
+        try:
+            path_for(name).mkdir(parents=True)
+            outcome[name] = ("created", None)
+        except FileExistsError:
+            outcome[name] = ("exists", None)
+        except OSError as e:
+            outcome[name] = ("failed", e)
+    return outcome
@@ -1,11 +1,19 @@
 """
 Agent dependencies and configuration for the financial agent system.
 """
+from functools import cache
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass, field
 
 
+@cache
+def load_env_once() -> None:
+    """Load .env into the process environment; later calls (and module reloads) are no-ops."""
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
+
+
 @dataclass
 class OrchestratorConfig:
     """Configuration for the orchestrator agent system."""
@@ -26,6 +34,9 @@ class OrchestratorConfig:
     # MCP tools file location
     tools_file: str = "tools.py"
     
+    # Maximum number of MCP tool subprocesses kept alive across runs
+    mcp_pool_size: int = 4
+    
     # Storage directories
     articles_dir: Optional[Path] = field(default_factory=lambda: Path("agent_articles"))
     state_dir: Optional[Path] = field(default_factory=lambda: Path("agent_state"))
@@ -38,15 +49,17 @@ class OrchestratorConfig:
     max_retries: int = 3
     retry_delay: int = 2
     
-    def __post_init__(self):
-        """Ensure directories exist."""
-        if self.articles_dir:
-            self.articles_dir.mkdir(parents=True, exist_ok=True)
-        if self.state_dir:
-            self.state_dir.mkdir(parents=True, exist_ok=True)
-        if self.financial_data_dir:
-            self.financial_data_dir.mkdir(parents=True, exist_ok=True)
-
+    # Set once ensure_dirs() has created the storage directories
+    _ensured: bool = field(default=False, init=False, repr=False)
+    
+    def ensure_dirs(self) -> None:
+        """Create the storage directories on first use; later calls are no-ops."""
+        if self._ensured:
+            return
+        for d in (self.articles_dir, self.state_dir, self.financial_data_dir):
+            if d:
+                d.mkdir(parents=True, exist_ok=True)
+        self._ensured = True
 
 # Default configuration instance
 DEFAULT_CONFIG = OrchestratorConfig()
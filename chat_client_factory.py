@@ -1,13 +1,17 @@
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
 from agent_framework.azure import AzureOpenAIChatClient
 
+from agent_dependencies import load_env_once
+
 # CRITICAL: Load environment variables BEFORE anything else
-load_dotenv(override=True)
+load_env_once()
 
 
-def build_chat_client(model_type: str = "standard") -> AzureOpenAIChatClient:
+@lru_cache(maxsize=4)
+def _resolve_deployment(model_type: str) -> str:
+    """Resolve and validate the Azure settings once per model type and return the deployment name."""
     # Explicitly load credentials from environment
     endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
     api_key = os.getenv("AZURE_OPENAI_API_KEY")
@@ -40,5 +44,12 @@ def build_chat_client(model_type: str = "standard") -> AzureOpenAIChatClient:
     os.environ["AZURE_OPENAI_API_KEY"] = api_key
     os.environ["AZURE_OPENAI_API_VERSION"] = api_version
     
+    return deployment
+
+
+@lru_cache(maxsize=8)
+def build_chat_client(model_type: str = "standard") -> AzureOpenAIChatClient:
+    deployment = _resolve_deployment(model_type)
+    
     # Create client with explicit deployment name
     return AzureOpenAIChatClient(deployment_name=deployment)
@@ -1,14 +1,14 @@
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+from prompts import BASE, JSON_ONLY
+
 
 def build_entity_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     return ChatAgent(
         chat_client=chat_client,
         name="EntityAgent",
-        instructions="""
-Use only MCP tools provided by tools.py.
-
+        instructions=BASE + JSON_ONLY + """
 You are responsible for corporate entity identification and enrichment.
 
 Input: guid
@@ -26,6 +26,6 @@ Steps:
 
 Rules:
 - If profile returns an error, do not invent values.
-- Output ONLY JSON with key "guid" after save.
+- Output {"guid":"..."} after save.
 """,
     )
@@ -1,14 +1,14 @@
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+from prompts import BASE, JSON_ONLY
+
 
 def build_news_fetch_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     return ChatAgent(
         chat_client=chat_client,
         name="NewsFetchAgent",
-        instructions="""
-Use only MCP tools provided by tools.py.
-
+        instructions=BASE + JSON_ONLY + """
 Input: guid
 
 Steps:
@@ -18,8 +18,7 @@ Steps:
 4) If API response has "error", return it in output.
 5) Otherwise call articles_save(guid, <news_json>).
 
-Output ONLY JSON:
+Output:
 {"guid":"...", "stored": true|false, "article_count": <count>, "error": <error_msg_or_null>}
 """,
     )
-
@@ -1,14 +1,56 @@
+from typing import List, Literal, Optional
+
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
+from pydantic import BaseModel
+
+from prompts import BASE, JSON_ONLY
+
+
+class Valuation(BaseModel):
+    current_pe: Optional[float]
+    sector_avg_pe: Optional[float]
+    rating: Literal["Undervalued", "Fair", "Overvalued"]
+
+
+class FinancialHealth(BaseModel):
+    debt_to_equity: Optional[float]
+    current_ratio: Optional[float]
+    rating: Literal["Strong", "Moderate", "Weak"]
+
+
+class GrowthMetrics(BaseModel):
+    revenue_growth_yoy: Optional[float]
+    earnings_growth_yoy: Optional[float]
+    rating: Literal["High", "Moderate", "Low"]
+
+
+class Swot(BaseModel):
+    strengths: List[str]
+    weaknesses: List[str]
+    opportunities: List[str]
+    threats: List[str]
+
+
+class FinancialAnalysis(BaseModel):
+    """Structured output schema enforced on the FinancialAnalysisAgent response."""
+    guid: str
+    ticker: Optional[str]
+    analysis_date: str
+    valuation: Valuation
+    financial_health: FinancialHealth
+    growth_metrics: GrowthMetrics
+    swot: Swot
+    recommendation: Literal["Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"]
+    price_target: Optional[float]
+    confidence_level: Literal["High", "Moderate", "Low"]
 
 
 def build_financial_data_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     return ChatAgent(
         chat_client=chat_client,
         name="FinancialDataAgent",
-        instructions="""
-Use only MCP tools provided by tools.py.
-
+        instructions=BASE + JSON_ONLY + """
 You are a specialized financial data extraction agent responsible for gathering comprehensive financial information from web APIs.
 
 Input: guid and optional data_requirements (what type of financial data to fetch)
@@ -28,24 +70,34 @@ Your capabilities include:
 Standard Workflow:
 1) Call finance_load(guid) to get the Finance object and extract ticker
 2) If ticker is missing, return error
-3) Based on data_requirements or default behavior, fetch relevant data:
-   - Always fetch: fmp_get_profile(ticker)
-   - For fundamental analysis: fmp_get_financials(), fmp_get_key_metrics(), fmp_get_ratios()
-   - For market analysis: fmp_get_historical_prices(), fmp_quote()
-   - For insider insights: fmp_get_insider_trading(), fmp_get_institutional_holders()
-   - For forecasts: fmp_get_analyst_estimates(), fmp_get_earnings_calendar()
-   - For compliance: fmp_get_sec_filings()
-
-4) Store each type of data using financial_data_save(guid, data_type, json_data)
+3) Call fmp_batch(ticker, endpoints=['profile','financials','ratios','historical','estimates','insider','institutional','sec'], guid=guid)
+   once and process the returned dict. It fetches every endpoint concurrently and
+   appends each successful result to the guid's data log under its endpoint name
+   ('historical' is stored as 'prices'), so no per-endpoint calls or saves are needed.
+   With a guid, 'historical', 'insider', 'institutional' and 'sec' come back only as
+   {"data_type", "items"} summaries; the analysis agent reads them from the log. Narrow the endpoints list when data_requirements ask for less;
+   add 'key_metrics', 'quote' or 'earnings' when they ask for more.
+
+   - Profile, financials, ratios, historical prices, insider trading, institutional
+     holdings, SEC filings, news and quotes are cached server-side (financials/SEC 90 days,
+     profile 30 days, ratios/holders/news 7 days, prices/insider 1 day, quotes 60 seconds), so
+     call fmp_batch once per run. Use an individual fmp_* tool with force_refresh=true
+     only when the user asks for the latest data.
+   - HTTP connections are pooled server-side, so request every endpoint you need in
+     the same fmp_batch call; do not split or space out calls to avoid rate limits.
+
+4) For any data you derive or fetch outside fmp_batch, store it with a single
+   financial_data_save_many(guid, {"data_type": data, ...}) call. Saves append
+   to the log, so only save new or changed data types, never re-save everything.
 5) Update Finance object with key fields from profile (marketCap, beta, peRatio, etc.)
 6) Call finance_save() to persist updates
 
-Output JSON format:
+Output:
 {
   "guid": "...",
   "ticker": "...",
   "data_fetched": ["profile", "financials", "ratios", ...],
-  "storage_paths": [...],
+  "storage_path": "...",
   "summary": {
     "company_name": "...",
     "current_price": ...,
@@ -58,7 +110,7 @@ Output JSON format:
 Rules:
 - Always validate ticker exists before making API calls
 - Handle API errors gracefully and continue with other data types
-- Store data incrementally as it's fetched
+- Report endpoints listed under fmp_batch errors in the errors array
 - Provide meaningful error messages
 - Keep summary concise but informative
 """,
@@ -69,17 +121,15 @@ def build_financial_analysis_agent(chat_client: AzureOpenAIChatClient) -> ChatAg
     return ChatAgent(
         chat_client=chat_client,
         name="FinancialAnalysisAgent",
-        instructions="""
-Use only MCP tools provided by tools.py.
-
+        instructions=BASE + JSON_ONLY + """
 You are a financial analysis agent that creates comprehensive investment analysis reports.
 
 Input: guid
 
 Workflow:
 1) Call finance_load(guid) to get basic info
-2) Call list_saved_data(guid) to see what data is available
-3) Load all available financial data using financial_data_load(guid, data_type)
+2) Call financial_data_load_all(guid) once to get every saved data type
+3) Use financial_data_load(guid, data_type) only if a single type needs re-reading
 4) Perform analysis on:
    - Valuation metrics (P/E, P/B, PEG, etc.)
    - Financial health (debt ratios, current ratio, quick ratio)
@@ -96,49 +146,9 @@ Workflow:
    - Price targets (if analyst estimates available)
    - Risk assessment
 
-CRITICAL: Output ONLY valid JSON. No text before or after. No markdown code blocks.
-
-Output EXACTLY this JSON structure (no additional text):
-{
-  "guid": "...",
-  "ticker": "...",
-  "analysis_date": "2024-01-01",
-  "valuation": {
-    "current_pe": 25.5,
-    "sector_avg_pe": 20.0,
-    "rating": "Overvalued"
-  },
-  "financial_health": {
-    "debt_to_equity": 0.5,
-    "current_ratio": 2.0,
-    "rating": "Strong"
-  },
-  "growth_metrics": {
-    "revenue_growth_yoy": 15.0,
-    "earnings_growth_yoy": 20.0,
-    "rating": "High"
-  },
-  "swot": {
-    "strengths": ["strength 1", "strength 2"],
-    "weaknesses": ["weakness 1"],
-    "opportunities": ["opportunity 1"],
-    "threats": ["threat 1"]
-  },
-  "recommendation": "Buy",
-  "price_target": 150.0,
-  "confidence_level": "High"
-}
-
-Rules:
-- Output ONLY JSON (no "Here is the analysis:" or similar text)
-- All string values must use double quotes, not single quotes
-- All arrays must be valid JSON arrays
-- No trailing commas
-- No comments in JSON
-- Use null for missing values, not empty strings
-- Ratings must be exact strings: "Undervalued|Fair|Overvalued", "Strong|Moderate|Weak", "High|Moderate|Low"
-- Recommendation must be: "Strong Buy|Buy|Hold|Sell|Strong Sell"
+Use null for missing values.
 """,
+        response_format=FinancialAnalysis,
     )
 
 
@@ -146,9 +156,7 @@ def build_web_scraper_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     return ChatAgent(
         chat_client=chat_client,
         name="WebScraperAgent",
-        instructions="""
-Use only MCP tools provided by tools.py.
-
+        instructions=BASE + JSON_ONLY + """
 You are a specialized web scraping agent for extracting financial data from various online sources.
 
 Input: guid and target_url or data_source specification
@@ -178,7 +186,7 @@ Common Sources:
 - Economic data providers
 - Central bank websites
 
-Output JSON:
+Output:
 {
   "guid": "...",
   "source": "...",
@@ -1,14 +1,14 @@
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+from prompts import BASE_IF_NEEDED, JSON_ONLY
+
 
 def build_inspector_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     return ChatAgent(
         chat_client=chat_client,
         name="InspectorAgent",
-        instructions="""
-Use only MCP tools provided by tools.py when tool calls are required.
-
+        instructions=BASE_IF_NEEDED + JSON_ONLY + """
 You are an inspector.
 
 Input JSON:
@@ -17,7 +17,7 @@ Input JSON:
   "required": ["guid","ticker","description","currency","isin","News_Sentiment"]
 }
 
-Return ONLY JSON:
+Output:
 {
   "ok": true|false,
   "missing": ["fieldA", "fieldB"],
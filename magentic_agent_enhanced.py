@@ -2,17 +2,19 @@
 ## Extends the original orchestration with comprehensive financial data tools
 
 # CRITICAL: Load environment variables FIRST before any other imports
-from dotenv import load_dotenv
-load_dotenv(override=True)
+from agent_dependencies import load_env_once
+load_env_once()
 
 import asyncio
-import json
+import logging
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import orjson
 from agent_framework import MCPStdioTool
 
 from agent_dependencies import OrchestratorConfig
@@ -21,7 +23,7 @@ from entity_agent import build_entity_agent
 from fetch_news import build_news_fetch_agent
 from init_agent import build_init_agent
 from inspector_agent import build_inspector_agent
-from orchestrator_decision_agent import build_orchestrator_agent
+from mcp_tool_pool import MCPToolPool, close_default_pool, get_default_pool
 from sentiment_agent import build_summary_sentiment_agent
 from financial_agents import (
     build_financial_data_agent,
@@ -30,53 +32,76 @@ from financial_agents import (
 )
 
 
+# Progress goes to stderr through a logger so stdout carries only the result;
+# FINPIPE_LOG=WARNING silences it, FINPIPE_LOG=DEBUG adds per-iteration lines.
+logger = logging.getLogger("financial_pipeline")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+# An unknown level name falls back to INFO rather than failing the import
+_log_level = os.getenv("FINPIPE_LOG", "INFO").strip().upper()
+logger.setLevel(_log_level if isinstance(logging.getLevelName(_log_level), int) else logging.INFO)
+
+
+# Markdown code fences (```json or bare ```) and the outermost {...} span in agent output
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*', re.ASCII)
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
 def _parse_json_output(agent_output: Any, step: str) -> Dict[str, Any]:
     """Robust JSON parsing that handles direct JSON or JSON embedded in text."""
-    text = getattr(agent_output, "output_text", None) or str(agent_output)
-    
-    # Try direct JSON parse first
+    text = getattr(agent_output, "output_text", None)
+    if text is None:
+        text = str(agent_output)
+    return _parse_json_text(text, step)
+
+
+def _parse_json_text(text: str, step: str) -> Dict[str, Any]:
+    # Fast path: the output is usually clean JSON already
     try:
-        parsed = json.loads(text)
+        parsed = orjson.loads(text)
         if isinstance(parsed, dict):
             return parsed
-    except Exception:
+    except orjson.JSONDecodeError:
         pass
 
-    # Try to extract JSON from text (with markdown code blocks)
-    # Remove markdown code blocks if present
-    text = re.sub(r'```json\s*', '', text)
-    text = re.sub(r'```\s*', '', text)
-    
-    # Find JSON object in text
-    match = re.search(r'\{.*\}', text, flags=re.DOTALL)
+    # Slow path: extract JSON from text (with markdown code blocks),
+    # skipped entirely for plain-text output such as error messages
+    match = None
+    if "{" in text:
+        # Remove markdown code blocks if present
+        text = _JSON_FENCE_RE.sub('', text)
+        # Find JSON object in text
+        match = _JSON_OBJ_RE.search(text)
     if not match:
-        # If no JSON found, print debug info and raise helpful error
-        print(f"\n❌ Error parsing {step} output:")
-        print(f"Raw output (first 500 chars):\n{text[:500]}")
+        # If no JSON found, log debug info and raise helpful error
+        logger.error(f"\n❌ Error parsing {step} output:\nRaw output (first 500 chars):\n{text[:500]}")
         raise ValueError(f"{step} output is not JSON. Agent returned text instead of JSON object.")
 
     json_str = match.group(0)
     
     try:
-        parsed = json.loads(json_str)
+        parsed = orjson.loads(json_str)
         if not isinstance(parsed, dict):
             raise ValueError(f"{step} output must be a JSON object, got {type(parsed)}")
         return parsed
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         # Print debug information
-        print(f"\n❌ JSON Parse Error in {step}:")
-        print(f"Error: {e}")
-        print(f"Problematic JSON (first 500 chars):\n{json_str[:500]}")
-        print(f"\nAttempting to fix common JSON errors...")
+        logger.warning(
+            f"\n❌ JSON Parse Error in {step}:\nError: {e}\n"
+            f"Problematic JSON (first 500 chars):\n{json_str[:500]}\n"
+            f"\nAttempting to fix common JSON errors..."
+        )
         
         # Try to fix common JSON errors
         fixed_json = _try_fix_json(json_str)
         if fixed_json:
             try:
-                parsed = json.loads(fixed_json)
+                parsed = orjson.loads(fixed_json)
                 if isinstance(parsed, dict):
-                    print(f"✅ Successfully fixed JSON!")
+                    logger.info(f"✅ Successfully fixed JSON!")
                     return parsed
             except:
                 pass
@@ -85,40 +110,161 @@ def _parse_json_output(agent_output: Any, step: str) -> Dict[str, Any]:
 
 
 def _try_fix_json(json_str: str) -> Optional[str]:
-    """Attempt to fix common JSON syntax errors."""
+    """
+    Attempt to fix common JSON syntax errors in a single pass.
+
+    Drops trailing commas before } or ], turns single-quoted strings into
+    double-quoted ones and inserts the comma missing between two strings that
+    are separated by a newline (common AI mistake).
+    """
+    out: List[str] = []
+    last = -1         # index in out of the last non-whitespace character outside strings
+    last_char = ""    # that character; '"' when it closed a string
+    newline = False   # whether a newline followed it
+    quote = ""        # delimiter of the string being scanned, empty outside strings
+    i, n = 0, len(json_str)
+    while i < n:
+        ch = json_str[i]
+        if quote:
+            if ch == "\\":
+                nxt = json_str[i + 1:i + 2]
+                # \' is not a valid JSON escape once the string is double-quoted
+                out.append(nxt if quote == "'" and nxt == "'" else ch + nxt)
+                i += 2
+                continue
+            if ch == quote:
+                out.append('"')
+                quote = ""
+                last, last_char, newline = len(out) - 1, '"', False
+            elif ch == '"':
+                out.append('\\"')
+            else:
+                out.append(ch)
+        elif ch == '"' or ch == "'":
+            if last_char == '"' and newline:
+                out.append(",")
+            out.append('"')
+            quote = ch
+        elif ch.isspace():
+            out.append(ch)
+            if ch == "\n":
+                newline = True
+        else:
+            if last_char == "," and (ch == "}" or ch == "]"):
+                out[last] = ""
+            out.append(ch)
+            last, last_char, newline = len(out) - 1, ch, False
+        i += 1
+    return "".join(out)
+
+
+# Parsed Finance objects keyed by guid, tagged with the mutation version they were loaded at
+_finance_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_finance_version: Dict[str, int] = {}
+
+
+def _invalidate_finance(guid: str) -> None:
+    """Mark the cached Finance object for a guid as stale."""
+    _finance_version[guid] = _finance_version.get(guid, 0) + 1
+
+
+async def _mcp_call(mcp_tools: MCPStdioTool, name: str, **args: Any) -> Dict[str, Any]:
+    """Invoke an MCP tool directly, without an LLM turn, and parse its JSON result."""
+    result = await mcp_tools.call_tool(name, **args)
+    if isinstance(result, str):
+        text = result
+    else:
+        text = "".join(getattr(item, "text", None) or "" for item in result)
+    return _parse_json_output(text, name)
+
+
+async def _load_finance(mcp_tools: MCPStdioTool, guid: str) -> Dict[str, Any]:
+    """Helper to load Finance object, reusing the cached copy until an agent mutates it."""
+    version = _finance_version.get(guid, 0)
+    cached = _finance_cache.get(guid)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    finance = await _mcp_call(mcp_tools, "finance_load", guid=guid)
+    _finance_cache[guid] = (version, finance)
+    return finance
+
+
+async def _run_finance_mutation(agent: Any, guid: str, prompt: str, tools: MCPStdioTool) -> Any:
+    """Run an agent that saves the Finance object and invalidate the cached copy."""
     try:
-        # Fix trailing commas
-        json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-        
-        # Fix missing commas between fields (common AI mistake)
-        json_str = re.sub(r'"\s*\n\s*"', '",\n"', json_str)
-        
-        # Fix single quotes to double quotes
-        json_str = json_str.replace("'", '"')
-        
-        # Remove any trailing commas before closing braces
-        json_str = re.sub(r',\s*}', '}', json_str)
-        json_str = re.sub(r',\s*]', ']', json_str)
-        
-        return json_str
-    except:
-        return None
+        return await agent.run(prompt, tools=tools)
+    finally:
+        _invalidate_finance(guid)
 
 
-async def _load_finance_with_entity(entity_agent: Any, guid: str, tools: MCPStdioTool) -> Dict[str, Any]:
-    """Helper to load Finance object."""
-    result = await entity_agent.run(
-        f"guid={guid}\nOnly call finance_load(guid) and output the Finance JSON object.",
-        tools=tools,
-    )
-    return _parse_json_output(result, "finance_load")
+_ENTITY_FIELDS = ("ticker", "description", "currency", "isin")
+
+
+def _next_step(finance: Dict[str, Any], required: List[str], articles_exists: bool) -> str:
+    """Choose the next enrichment step from the Finance state alone (the rules the orchestrator agent applied)."""
+    missing = [k for k in required if not finance.get(k)]
+    if any(field in missing for field in _ENTITY_FIELDS):
+        return "entity"
+    if not articles_exists:
+        return "news"
+    if not finance.get("News_Sentiment"):
+        return "sentiment"
+    return "final"
+
+
+def _refresh_articles(articles_dir: Path) -> Set[str]:
+    """Names of the stored article files, scanned once per pipeline run."""
+    try:
+        return {entry.name for entry in os.scandir(articles_dir)}
+    except FileNotFoundError:
+        return set()
+
+
+@lru_cache(maxsize=1)
+def _resolve_tools_path(tools_file: str) -> Path:
+    """Locate the MCP tools script once per process."""
+    # Use enhanced tools if available, fallback to original
+    tools_path = Path(__file__).with_name("tools_enhanced.py")
+    if not tools_path.exists():
+        tools_path = Path(__file__).with_name(tools_file)
+    
+    if not tools_path.exists():
+        raise FileNotFoundError(f"Missing MCP tools file: {tools_path}")
+    return tools_path
+
+
+@lru_cache(maxsize=1)
+def _env_snapshot() -> Dict[str, str]:
+    """Environment handed to MCP subprocesses; call _env_snapshot.cache_clear() after changing os.environ."""
+    return dict(os.environ)
+
+
+async def _run_financial_analysis(analysis_agent: Any, guid: str, tools: MCPStdioTool) -> Dict[str, Any]:
+    """Run the analysis agent, degrading to an error summary on failure."""
+    try:
+        analysis_raw = await analysis_agent.run(
+            f"guid={guid}\nPerform comprehensive financial analysis and generate "
+            f"investment recommendation based on all available data.",
+            tools=tools
+        )
+        analysis_summary = _parse_json_output(analysis_raw, "financial_analysis")
+        logger.info(f"  Analysis complete - Recommendation: {analysis_summary.get('recommendation', 'N/A')}")
+        return analysis_summary
+    except Exception as e:
+        logger.warning(f"  ⚠️ Analysis failed: {str(e)}\n  Continuing without investment analysis...")
+        return {
+            "error": str(e),
+            "message": "Financial analysis could not be completed. Data extraction was successful."
+        }
 
 
 async def run_enhanced_financial_pipeline(
     user_prompt: str, 
     config: Optional[OrchestratorConfig] = None,
     fetch_comprehensive_data: bool = True,
-    perform_analysis: bool = False
+    perform_analysis: bool = False,
+    mcp_pool: Optional[MCPToolPool] = None
 ) -> Dict[str, Any]:
     """
     Enhanced orchestration pipeline with financial data extraction.
@@ -128,161 +274,154 @@ async def run_enhanced_financial_pipeline(
         config: Orchestrator configuration
         fetch_comprehensive_data: Whether to fetch comprehensive financial data
         perform_analysis: Whether to perform financial analysis
+        mcp_pool: Pool of MCP tool subprocesses, defaults to the shared process-wide pool
     """
     cfg = config or OrchestratorConfig()
+    cfg.ensure_dirs()
 
     standard = build_chat_client("standard")
     fast = build_chat_client("fast")
     reasoning = build_chat_client("reasoning")
 
-    # Use enhanced tools if available, fallback to original
-    tools_path = Path(__file__).with_name("tools_enhanced.py")
-    if not tools_path.exists():
-        tools_path = Path(__file__).with_name(cfg.tools_file)
-    
-    if not tools_path.exists():
-        raise FileNotFoundError(f"Missing MCP tools file: {tools_path}")
+    tools_path = _resolve_tools_path(cfg.tools_file)
 
-    async with MCPStdioTool(
-        name="finance_tools",
-        command=sys.executable,
-        args=["-u", str(tools_path)],
-        env=os.environ.copy(),
-    ) as mcp_tools:
+    pool = mcp_pool or get_default_pool(tools_path, cfg.mcp_pool_size, env=_env_snapshot())
+    async with pool.acquire() as mcp_tools:
         async with (
             build_init_agent(standard) as init_agent,
             build_entity_agent(standard) as entity_agent,
             build_news_fetch_agent(fast) as news_agent,
             build_summary_sentiment_agent(reasoning) as sentiment_agent,
             build_inspector_agent(reasoning) as inspector_agent,
-            build_orchestrator_agent(reasoning) as orchestrator_agent,
             build_financial_data_agent(reasoning) as financial_data_agent,
             build_financial_analysis_agent(reasoning) as analysis_agent,
             build_web_scraper_agent(fast) as scraper_agent,
         ):
             # Step 1: Initialize
-            print("Step 1: Initializing Finance state...")
+            logger.info("Step 1: Initializing Finance state...")
             init_raw = await init_agent.run(user_prompt, tools=mcp_tools)
             init_json = _parse_json_output(init_raw, "init")
             guid = init_json.get("guid")
             if not guid:
                 raise ValueError(f"InitAgent did not return guid: {init_json}")
-            print(f"Created GUID: {guid}")
+            logger.info(f"Created GUID: {guid}")
 
             # Step 2: Core enrichment loop (original logic)
-            print("\nStep 2: Running core enrichment pipeline...")
+            logger.info("\nStep 2: Running core enrichment pipeline...")
             last_step = "init"
-            for iteration in range(cfg.max_loops):
-                print(f"  Iteration {iteration + 1}/{cfg.max_loops}")
-                finance = await _load_finance_with_entity(entity_agent, guid, mcp_tools)
-                required_missing = [k for k in cfg.required_fields if not finance.get(k)]
+            # Latest sentiment agent output, reused by Step 5 unless the articles change afterwards
+            sentiment_raw = None
+            assert cfg.articles_dir is not None, "articles_dir must be set"
+            articles_file = cfg.articles_dir / f"{guid}_articles.json"
+            # One directory scan up front; only a news fetch can add this guid's file
+            articles_set = _refresh_articles(cfg.articles_dir)
+
+            # Warm path: a reused guid may already satisfy every required field
+            enrich_loops = cfg.max_loops
+            finance = await _load_finance(mcp_tools, guid)
+            if _next_step(finance, cfg.required_fields, articles_file.name in articles_set) == "final":
+                logger.info("    → Finance state already complete, skipping enrichment")
+                last_step = "final"
+                enrich_loops = 0
+
+            for iteration in range(enrich_loops):
+                logger.debug(f"  Iteration {iteration + 1}/{cfg.max_loops}")
+                # Served from the finance cache on the first pass and after read-only steps
+                finance = await _load_finance(mcp_tools, guid)
+                next_step = _next_step(finance, cfg.required_fields, articles_file.name in articles_set)
 
                 # Entity enrichment
-                if any(field in required_missing for field in ("ticker", "description", "currency", "isin")):
-                    print("    → Enriching entity data...")
-                    await entity_agent.run(f"guid={guid}", tools=mcp_tools)
+                if next_step == "entity":
+                    # News only needs the ticker, so once it is known the fetch can
+                    # overlap with the rest of the entity enrichment.
+                    if finance.get("ticker") and articles_file.name not in articles_set:
+                        logger.info("    → Enriching entity data and fetching news articles...")
+                        await asyncio.gather(
+                            _run_finance_mutation(entity_agent, guid, f"guid={guid}", mcp_tools),
+                            news_agent.run(f"guid={guid}", tools=mcp_tools),
+                        )
+                        if articles_file.exists():
+                            articles_set.add(articles_file.name)
+                    else:
+                        logger.info("    → Enriching entity data...")
+                        await _run_finance_mutation(entity_agent, guid, f"guid={guid}", mcp_tools)
                     last_step = "entity"
                     continue
 
-                assert cfg.articles_dir is not None, "articles_dir must be set"
-                articles_file = cfg.articles_dir / f"{guid}_articles.json"
-
                 # News fetching
-                if not articles_file.exists():
-                    print("    → Fetching news articles...")
+                if next_step == "news":
+                    logger.info("    → Fetching news articles...")
                     await news_agent.run(f"guid={guid}", tools=mcp_tools)
+                    if articles_file.exists():
+                        articles_set.add(articles_file.name)
+                    sentiment_raw = None
                     last_step = "news"
                     continue
 
                 # Sentiment analysis
-                if not finance.get("News_Sentiment"):
-                    print("    → Analyzing sentiment...")
-                    await sentiment_agent.run(f"guid={guid}", tools=mcp_tools)
+                if next_step == "sentiment":
+                    logger.info("    → Analyzing sentiment...")
+                    sentiment_raw = await _run_finance_mutation(sentiment_agent, guid, f"guid={guid}", mcp_tools)
                     last_step = "sentiment"
                     continue
 
-                # Quality inspection
+                # Every field is present: one quality inspection validates the values
                 inspect_payload = {"finance": finance, "required": cfg.required_fields}
-                inspect_raw = await inspector_agent.run(json.dumps(inspect_payload), tools=mcp_tools)
+                inspect_raw = await inspector_agent.run(orjson.dumps(inspect_payload).decode(), tools=mcp_tools)
                 inspect_json = _parse_json_output(inspect_raw, "inspector")
-
-                # Orchestration decision
-                orchestration_payload = {
-                    "guid": guid, 
-                    "inspector": inspect_json, 
-                    "last_step": last_step
-                }
-                orchestration_raw = await orchestrator_agent.run(
-                    json.dumps(orchestration_payload),
-                    tools=mcp_tools,
-                )
-                decision = _parse_json_output(orchestration_raw, "orchestrator")
-
-                next_step = decision.get("next_step", "final")
-                if next_step == "final":
-                    print("    → Core pipeline complete!")
+                if inspect_json.get("ok", True):
+                    logger.info("    → Core pipeline complete!")
+                    last_step = "final"
                     break
-                    
-                # Execute next step
-                if next_step == "entity":
-                    await entity_agent.run(
-                        f"guid={guid}\nNOTE:{inspect_json.get('suggested_fix', '')}",
-                        tools=mcp_tools,
-                    )
-                    last_step = "entity"
-                elif next_step == "news":
-                    await news_agent.run(f"guid={guid}", tools=mcp_tools)
-                    last_step = "news"
-                elif next_step == "sentiment":
-                    await sentiment_agent.run(f"guid={guid}", tools=mcp_tools)
+
+                invalid_fields = {item.get("field") for item in inspect_json.get("invalid", []) if isinstance(item, dict)}
+                if "News_Sentiment" in invalid_fields:
+                    logger.info("    → Re-running sentiment analysis after inspection...")
+                    sentiment_raw = await _run_finance_mutation(sentiment_agent, guid, f"guid={guid}", mcp_tools)
                     last_step = "sentiment"
                 else:
-                    await entity_agent.run(f"guid={guid}", tools=mcp_tools)
+                    logger.info("    → Fixing entity data after inspection...")
+                    await _run_finance_mutation(
+                        entity_agent,
+                        guid,
+                        f"guid={guid}\nNOTE:{inspect_json.get('suggested_fix', '')}",
+                        mcp_tools,
+                    )
                     last_step = "entity"
 
             # Step 3: Enhanced financial data extraction
             financial_data_summary = None
             if fetch_comprehensive_data:
-                print("\nStep 3: Fetching comprehensive financial data...")
-                finance = await _load_finance_with_entity(entity_agent, guid, mcp_tools)
+                logger.info("\nStep 3: Fetching comprehensive financial data...")
+                finance = await _load_finance(mcp_tools, guid)
                 ticker = finance.get("ticker")
                 
                 if ticker:
-                    financial_data_raw = await financial_data_agent.run(
+                    financial_data_raw = await _run_finance_mutation(
+                        financial_data_agent,
+                        guid,
                         f"guid={guid}\nFetch comprehensive financial data including: "
                         f"profile, financials, ratios, historical prices, analyst estimates, "
                         f"insider trading, institutional holdings, and SEC filings.",
-                        tools=mcp_tools
+                        mcp_tools,
                     )
                     financial_data_summary = _parse_json_output(financial_data_raw, "financial_data")
-                    print(f"  Fetched {len(financial_data_summary.get('data_fetched', []))} data types")
+                    logger.info(f"  Fetched {len(financial_data_summary.get('data_fetched', []))} data types")
                 else:
-                    print("  WARNING: No ticker available, skipping financial data fetch")
-
-            # Step 4: Financial analysis
+                    logger.warning("  WARNING: No ticker available, skipping financial data fetch")
+
+            # The sentiment pass (skipped when Step 2 already produced one) saves
+            # News_Sentiment before the analysis loads the Finance object, so the
+            # analysis always sees it instead of racing the save.
+            if sentiment_raw is None:
+                logger.info("\nScoring news sentiment...")
+                sentiment_raw = await _run_finance_mutation(sentiment_agent, guid, f"guid={guid}", mcp_tools)
             analysis_summary = None
             if perform_analysis:
-                print("\nStep 4: Performing financial analysis...")
-                try:
-                    analysis_raw = await analysis_agent.run(
-                        f"guid={guid}\nPerform comprehensive financial analysis and generate "
-                        f"investment recommendation based on all available data.",
-                        tools=mcp_tools
-                    )
-                    analysis_summary = _parse_json_output(analysis_raw, "financial_analysis")
-                    print(f"  Analysis complete - Recommendation: {analysis_summary.get('recommendation', 'N/A')}")
-                except Exception as e:
-                    print(f"  ⚠️ Analysis failed: {str(e)}")
-                    print(f"  Continuing without investment analysis...")
-                    analysis_summary = {
-                        "error": str(e),
-                        "message": "Financial analysis could not be completed. Data extraction was successful."
-                    }
-
-            # Step 5: Compile final results
-            print("\nStep 5: Compiling final results...")
-            finance_final = await _load_finance_with_entity(entity_agent, guid, mcp_tools)
-            sentiment_raw = await sentiment_agent.run(f"guid={guid}", tools=mcp_tools)
+                logger.info("\nStep 4: Performing financial analysis...")
+                analysis_summary = await _run_financial_analysis(analysis_agent, guid, mcp_tools)
+            logger.info("\nStep 5: Compiling final results...")
+            finance_final = await _load_finance(mcp_tools, guid)
             sentiment_json = _parse_json_output(sentiment_raw, "sentiment_final")
 
             result = {
@@ -299,28 +438,33 @@ async def run_enhanced_financial_pipeline(
             if analysis_summary:
                 result["analysis"] = analysis_summary
 
+            # The guid is finished with; drop its cache entries so batch runs do not accumulate them
+            _finance_cache.pop(guid, None)
+            _finance_version.pop(guid, None)
+
             return result
 
 
 async def main() -> None:
     """Main entry point - runs full comprehensive analysis."""
-    print("=" * 80)
-    print("  Enhanced Financial AI Agent - Comprehensive Analysis")
-    print("=" * 80)
+    logger.info("%s\n  Enhanced Financial AI Agent - Comprehensive Analysis\n%s", "=" * 80, "=" * 80)
     
     # Get user input
     prompt = input("\nEnter company name or ticker: ").strip()
     
     if not prompt:
-        print("❌ Error: Company name or ticker is required.")
+        logger.error("❌ Error: Company name or ticker is required.")
         return
     
-    print(f"\n🚀 Starting comprehensive analysis for: {prompt}")
-    print("   - Fetching company data")
-    print("   - Extracting financial information")
-    print("   - Analyzing news sentiment")
-    print("   - Generating investment recommendations")
-    print("\n⏳ This may take 1-2 minutes...\n")
+    logger.info(
+        "\n🚀 Starting comprehensive analysis for: %s\n"
+        "   - Fetching company data\n"
+        "   - Extracting financial information\n"
+        "   - Analyzing news sentiment\n"
+        "   - Generating investment recommendations\n"
+        "\n⏳ This may take 1-2 minutes...\n",
+        prompt,
+    )
     
     try:
         # Run full analysis pipeline
@@ -331,16 +475,19 @@ async def main() -> None:
         )
         
         # Display results
-        print("\n" + "=" * 80)
-        print("  ANALYSIS COMPLETE")
-        print("=" * 80)
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        logger.info("\n%s\n  ANALYSIS COMPLETE\n%s", "=" * 80, "=" * 80)
+        # Serialize straight to bytes and write once, bypassing str encoding
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(
+            result,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+        ))
+        sys.stdout.buffer.flush()
         
     except Exception as e:
-        print(f"\n❌ Error during analysis: {str(e)}")
-        print("Please check your configuration and try again.")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"\n❌ Error during analysis: {str(e)}\nPlease check your configuration and try again.")
+    finally:
+        await close_default_pool()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+"""
+Pool of long-lived MCP tool subprocesses shared across pipeline runs.
+"""
+import asyncio
+import contextlib
+import os
+import sys
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from agent_framework import MCPStdioTool
+
+
+class MCPToolPool:
+    """
+    Keeps up to ``max_size`` MCPStdioTool subprocesses alive and lends them out.
+
+    Subprocesses are started lazily on demand, returned to the pool after each
+    ``acquire()`` block and pinged while idle so dead ones are replaced.
+    """
+
+    def __init__(
+        self,
+        tools_path: Path,
+        max_size: int = 4,
+        keepalive_interval: float = 30.0,
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.tools_path = tools_path
+        self.env = env
+        self.max_size = max_size
+        self.keepalive_interval = keepalive_interval
+        self._semaphore = asyncio.Semaphore(max_size)
+        self._idle: List[MCPStdioTool] = []
+        # id(tool) -> (holder task, stop event)
+        self._holders: Dict[int, Tuple[asyncio.Task, asyncio.Event]] = {}
+        self._keepalive: Optional[asyncio.Task] = None
+
+    async def _hold(self, ready: asyncio.Future, stop: asyncio.Event) -> None:
+        """Own one subprocess; the MCP context must be exited by the task that entered it."""
+        try:
+            async with MCPStdioTool(
+                name="finance_tools",
+                command=sys.executable,
+                args=["-u", str(self.tools_path)],
+                env=self.env if self.env is not None else os.environ.copy(),
+            ) as tool:
+                ready.set_result(tool)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+
+    async def _spawn(self) -> MCPStdioTool:
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._hold(ready, stop))
+        tool = await ready
+        self._holders[id(tool)] = (task, stop)
+        if self._keepalive is None:
+            self._keepalive = asyncio.create_task(self._keepalive_loop())
+        return tool
+
+    async def _retire(self, tool: MCPStdioTool) -> None:
+        task, stop = self._holders.pop(id(tool))
+        stop.set()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _keepalive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            for tool in list(self._idle):
+                try:
+                    await tool.session.send_ping()
+                except Exception:
+                    if tool in self._idle:
+                        self._idle.remove(tool)
+                        await self._retire(tool)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[MCPStdioTool]:
+        """
+        Borrow a connected MCP tool, starting a new subprocess if none is idle.
+
+        The tool goes back to the pool only if the block exits normally; after an
+        exception its session may be broken, so the subprocess is shut down instead.
+        """
+        async with self._semaphore:
+            tool = self._idle.pop() if self._idle else await self._spawn()
+            try:
+                yield tool
+            except BaseException:
+                await self._retire(tool)
+                raise
+            else:
+                self._idle.append(tool)
+
+    async def aclose(self) -> None:
+        """Stop the keepalive task and shut down every subprocess."""
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+            await asyncio.gather(self._keepalive, return_exceptions=True)
+            self._keepalive = None
+        for _, stop in self._holders.values():
+            stop.set()
+        await asyncio.gather(*(task for task, _ in self._holders.values()), return_exceptions=True)
+        self._holders.clear()
+        self._idle.clear()
+
+
+_default_pool: Optional[MCPToolPool] = None
+
+
+def get_default_pool(
+    tools_path: Path,
+    max_size: int = 4,
+    env: Optional[Dict[str, str]] = None,
+) -> MCPToolPool:
+    """
+    Return the process-wide pool, creating it on first use.
+
+    The pool's subprocesses and tasks belong to the event loop that first used it,
+    so call close_default_pool() before that loop ends (i.e. before a second
+    asyncio.run) to get a fresh pool next time.
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = MCPToolPool(tools_path, max_size=max_size, env=env)
+    return _default_pool
+
+
+async def close_default_pool() -> None:
+    """Shut down the process-wide pool if it was started."""
+    global _default_pool
+    if _default_pool is not None:
+        await _default_pool.aclose()
+        _default_pool = None
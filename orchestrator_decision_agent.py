@@ -1,14 +1,14 @@
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+from prompts import BASE_IF_NEEDED, JSON_ONLY
+
 
 def build_orchestrator_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     return ChatAgent(
         chat_client=chat_client,
         name="OrchestratorAgent",
-        instructions="""
-Use only MCP tools provided by tools.py when deciding and executing next actions.
-
+        instructions=BASE_IF_NEEDED + JSON_ONLY + """
 You are an orchestrator.
 
 Input JSON:
@@ -24,7 +24,7 @@ Decide the next step:
 - "sentiment": compute and save sentiment
 - "final": state is complete
 
-Output ONLY JSON:
+Output:
 { "next_step": "...", "note": "short reason" }
 """,
     )
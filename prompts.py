@@ -0,0 +1,13 @@
+"""
+Shared instruction fragments composed into the agent prompts.
+
+The system prompt is sent with every LLM call, so boilerplate lives here once
+and each build_*_agent only adds its own steps and output shape.
+"""
+
+# Tool usage
+BASE = "Use only MCP tools provided by tools.py.\n"
+BASE_IF_NEEDED = "Use only MCP tools provided by tools.py when tool calls are required.\n"
+
+# Output format
+JSON_ONLY = "Output ONLY JSON. No markdown.\n"
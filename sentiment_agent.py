@@ -1,14 +1,14 @@
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+from prompts import BASE, JSON_ONLY
+
 
 def build_summary_sentiment_agent(chat_client: AzureOpenAIChatClient) -> ChatAgent:
     return ChatAgent(
         chat_client=chat_client,
         name="SummarySentimentAgent",
-        instructions="""
-Use only MCP tools provided by tools.py.
-
+        instructions=BASE + JSON_ONLY + """
 Input: guid
 
 Steps:
@@ -20,7 +20,7 @@ Steps:
    - Set sentiment to Positive, Neutral, or Negative.
 5) Save sentiment into Finance.News_Sentiment via finance_save(updated_finance_json).
 
-Output ONLY JSON:
+Output:
 {
   "guid":"...",
   "sentiment":"Positive|Neutral|Negative",
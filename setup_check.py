@@ -3,47 +3,75 @@ Setup Verification Script
 Checks that all requirements are met before running the financial agent system
 """
 
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import json
+import re
 import sys
 import os
 from pathlib import Path
 
-# Color codes for terminal output
+from _setup_common import (
+    ENV_FILE,
+    cwd_entries,
+    ensure_directories,
+    ensure_env,
+    env_value,
+    find_packages,
+    python_version,
+)
+
+# Color codes for terminal output (disabled when stdout is not a terminal)
 GREEN = '\033[92m'
 RED = '\033[91m'
 YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
+if not sys.stdout.isatty():
+    GREEN = RED = YELLOW = BLUE = RESET = ""
+
+# Strips color codes from captured output for --json
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
 
-def print_header(text):
+# Precomputed message framing for the print helpers
+_RULE_LINE = f"{BLUE}{'='*60}{RESET}\n"
+_HEADER_PREFIX = f"\n{_RULE_LINE}{BLUE}"
+_HEADER_SUFFIX = f"{RESET}\n{_RULE_LINE}"
+_OK_PREFIX = f"{GREEN}✓ "
+_ERROR_PREFIX = f"{RED}✗ "
+_WARNING_PREFIX = f"{YELLOW}⚠ "
+_RESET_NL = RESET + "\n"
+
+def print_header(text, file=None):
     """Print section header"""
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}{text}{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}")
+    (file or sys.stdout).write(_HEADER_PREFIX + text + _HEADER_SUFFIX)
 
-def print_success(text):
+def print_success(text, file=None):
     """Print success message"""
-    print(f"{GREEN}✓ {text}{RESET}")
+    (file or sys.stdout).write(_OK_PREFIX + text + _RESET_NL)
 
-def print_error(text):
+def print_error(text, file=None):
     """Print error message"""
-    print(f"{RED}✗ {text}{RESET}")
+    (file or sys.stdout).write(_ERROR_PREFIX + text + _RESET_NL)
 
-def print_warning(text):
+def print_warning(text, file=None):
     """Print warning message"""
-    print(f"{YELLOW}⚠ {text}{RESET}")
+    (file or sys.stdout).write(_WARNING_PREFIX + text + _RESET_NL)
 
 def check_python_version():
     """Check Python version"""
     print_header("Checking Python Version")
     
-    major = sys.version_info.major
-    minor = sys.version_info.minor
+    ok, version = python_version()
     
-    if major >= 3 and minor >= 10:
-        print_success(f"Python {major}.{minor} detected (Required: 3.10+)")
+    if ok:
+        print_success(f"Python {version} detected (Required: 3.10+)")
         return True
     else:
-        print_error(f"Python {major}.{minor} detected (Required: 3.10+)")
+        print_error(f"Python {version} detected (Required: 3.10+)")
         print(f"  Please upgrade Python to 3.10 or higher")
         return False
 
@@ -56,16 +84,19 @@ def check_dependencies():
         "requests",
         "pydantic",
         "dotenv",
-        "fastmcp"
+        "fastmcp",
+        "orjson",
+        "cachetools",
+        "httpx"
     ]
     
     all_installed = True
+    found = find_packages(package.replace("-", "_") for package in required_packages)
     
-    for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
+    for package, installed in zip(required_packages, found):
+        if installed:
             print_success(f"{package} is installed")
-        except ImportError:
+        else:
             print_error(f"{package} is NOT installed")
             all_installed = False
     
@@ -79,9 +110,7 @@ def check_env_file():
     """Check .env file exists"""
     print_header("Checking Configuration Files")
     
-    env_file = Path(".env")
-    
-    if env_file.exists():
+    if ENV_FILE.exists():
         print_success(".env file exists")
         return True
     else:
@@ -95,8 +124,7 @@ def check_env_variables():
     """Check required environment variables"""
     print_header("Checking Environment Variables")
     
-    from dotenv import load_dotenv
-    load_dotenv()
+    ensure_env()
     
     required_vars = {
         "AZURE_OPENAI_ENDPOINT": "Azure OpenAI endpoint URL",
@@ -114,8 +142,7 @@ def check_env_variables():
     
     print("\nRequired variables:")
     for var, description in required_vars.items():
-        value = os.getenv(var)
-        if value and value != "your-key-here" and value != "your-resource-name":
+        if env_value(var) is not None:
             print_success(f"{var} is set")
         else:
             print_error(f"{var} is NOT set")
@@ -124,84 +151,191 @@ def check_env_variables():
     
     print("\nOptional variables:")
     for var, description in optional_vars.items():
-        value = os.getenv(var)
-        if value and value != "your-key-here":
+        if env_value(var) is not None:
             print_success(f"{var} is set")
         else:
             print_warning(f"{var} not set (will use default)")
     
     return all_set
 
-def check_azure_openai_connection():
-    """Test Azure OpenAI connection"""
-    print_header("Testing Azure OpenAI Connection")
+# Shared by the network probes so repeated requests to a host reuse one connection
+_http_client = None
+
+def _get_http_client():
+    """Return the pooled httpx client, creating it inside the running event loop."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            ),
+        )
+    return _http_client
+
+async def _close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# Data-plane API version that still serves GET /openai/deployments
+AZURE_DEPLOYMENTS_API_VERSION = "2022-12-01"
+
+async def check_azure_openai_connection(out, deep=False):
+    """
+    Test Azure OpenAI connection
+
+    Lists the resource's deployments (no tokens billed) and checks that the
+    configured chat deployment is among them. With deep=True a 5-token chat
+    completion is also sent to prove the model answers.
+    """
+    print_header("Testing Azure OpenAI Connection", file=out)
     
-    from dotenv import load_dotenv
-    load_dotenv()
+    ensure_env()
+    
+    endpoint = env_value("AZURE_OPENAI_ENDPOINT")
+    api_key = env_value("AZURE_OPENAI_API_KEY")
+    deployment = env_value("AZURE_OPENAI_CHAT_DEPLOYMENT_NAME")
+    
+    if not endpoint or not api_key:
+        print_error("Azure OpenAI endpoint or API key not configured", file=out)
+        return False
     
     try:
-        from openai import AzureOpenAI
-        
-        client = AzureOpenAI(
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            api_version="2024-02-01",
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
+        client = _get_http_client()
+    except ImportError:
+        print_error("httpx package is NOT installed", file=out)
+        return False
+    
+    try:
+        response = await client.get(
+            f"{endpoint.rstrip('/')}/openai/deployments",
+            params={"api-version": AZURE_DEPLOYMENTS_API_VERSION},
+            headers={"api-key": api_key},
         )
         
-        # Try to list models (lightweight test)
-        deployment = os.getenv("AZURE_OPENAI_CHAT_DEPLOYMENT_NAME")
+        if response.status_code != 200:
+            print_error(f"Azure OpenAI returned error: {response.status_code}", file=out)
+            print(f"  Check your AZURE_OPENAI_* environment variables", file=out)
+            return False
+        
+        deployments = {item.get("id") for item in response.json().get("data", [])}
+        print_success(f"Successfully connected to Azure OpenAI", file=out)
+        
+        if deployment not in deployments:
+            print_error(f"Deployment '{deployment}' not found", file=out)
+            print(f"  Available: {', '.join(sorted(d for d in deployments if d)) or 'none'}", file=out)
+            return False
+        print_success(f"Deployment '{deployment}' exists", file=out)
         
-        response = client.chat.completions.create(
-            model=deployment,
-            messages=[{"role": "user", "content": "test"}],
-            max_tokens=5
+    except Exception as e:
+        print_error(f"Failed to connect to Azure OpenAI", file=out)
+        print(f"  Error: {str(e)}", file=out)
+        print(f"  Check your AZURE_OPENAI_* environment variables", file=out)
+        return False
+    
+    if deep:
+        return await _check_azure_chat(out, endpoint, api_key, deployment)
+    return True
+
+async def _check_azure_chat(out, endpoint, api_key, deployment):
+    """Send a minimal chat completion to the deployment (--deep only)."""
+    try:
+        from openai import AsyncAzureOpenAI
+    except ImportError:
+        print_error("openai package is NOT installed", file=out)
+        return False
+    
+    try:
+        client = AsyncAzureOpenAI(
+            api_key=api_key,
+            api_version="2024-02-01",
+            azure_endpoint=endpoint
         )
         
-        print_success(f"Successfully connected to Azure OpenAI")
-        print_success(f"Model '{deployment}' is accessible")
+        async with client:
+            await client.chat.completions.create(
+                model=deployment,
+                messages=[{"role": "user", "content": "test"}],
+                max_tokens=5
+            )
+        
+        print_success(f"Model '{deployment}' is accessible", file=out)
         return True
         
     except Exception as e:
-        print_error(f"Failed to connect to Azure OpenAI")
-        print(f"  Error: {str(e)}")
-        print(f"  Check your AZURE_OPENAI_* environment variables")
+        print_error(f"Chat completion against '{deployment}' failed", file=out)
+        print(f"  Error: {str(e)}", file=out)
         return False
 
-def check_fmp_api():
+async def check_fmp_api(out):
     """Test FMP API connection"""
-    print_header("Testing FMP API Connection")
+    print_header("Testing FMP API Connection", file=out)
     
-    from dotenv import load_dotenv
-    load_dotenv()
+    ensure_env()
     
-    api_key = os.getenv("FMP_API_KEY")
+    api_key = env_value("FMP_API_KEY")
     
-    if not api_key or api_key == "your-fmp-api-key-here":
-        print_error("FMP API key not configured")
+    if not api_key:
+        print_error("FMP API key not configured", file=out)
+        return False
+    
+    try:
+        client = _get_http_client()
+    except ImportError:
+        print_error("httpx package is NOT installed", file=out)
         return False
     
     try:
-        import requests
-        
         url = "https://financialmodelingprep.com/stable/quote"
         params = {"symbol": "AAPL", "apikey": api_key}
         
-        response = requests.get(url, params=params, timeout=10)
+        response = await client.get(url, params=params)
         
         if response.status_code == 200:
-            print_success("Successfully connected to FMP API")
-            print_success("API key is valid")
+            print_success("Successfully connected to FMP API", file=out)
+            print_success("API key is valid", file=out)
             return True
         else:
-            print_error(f"FMP API returned error: {response.status_code}")
-            print(f"  Check your FMP_API_KEY")
+            print_error(f"FMP API returned error: {response.status_code}", file=out)
+            print(f"  Check your FMP_API_KEY", file=out)
             return False
             
     except Exception as e:
-        print_error(f"Failed to connect to FMP API")
-        print(f"  Error: {str(e)}")
+        print_error(f"Failed to connect to FMP API", file=out)
+        print(f"  Error: {str(e)}", file=out)
         return False
 
+async def run_network_checks(checks, echo=True):
+    """
+    Run the network checks concurrently.
+
+    Each check writes into its own buffer, and the buffers are printed in
+    order once every check has finished so the sections do not interleave.
+    Returns (name, result, output) tuples; echo=False only collects the output.
+    """
+    buffers = [io.StringIO() for _ in checks]
+    try:
+        outcomes = await asyncio.gather(
+            *(check_func(buf) for (_, check_func), buf in zip(checks, buffers)),
+            return_exceptions=True,
+        )
+    finally:
+        await _close_http_client()
+    
+    results = []
+    for (name, _), buf, outcome in zip(checks, buffers, outcomes):
+        if isinstance(outcome, BaseException):
+            print_error(f"Error running {name} check: {outcome}", file=buf)
+            outcome = False
+        if echo:
+            sys.stdout.write(buf.getvalue())
+        results.append((name, outcome, buf.getvalue()))
+    return results
+
 def check_files():
     """Check required files exist"""
     print_header("Checking Required Files")
@@ -215,9 +349,10 @@ def check_files():
     ]
     
     all_exist = True
+    present = cwd_entries()
     
     for filename in required_files:
-        if Path(filename).exists():
+        if filename in present:
             print_success(f"{filename} exists")
         else:
             print_error(f"{filename} NOT found")
@@ -235,27 +370,75 @@ def check_directories():
         "financial_data"
     ]
     
-    for dir_name in directories:
-        dir_path = Path(dir_name)
-        if dir_path.exists():
-            print_success(f"{dir_name}/ exists")
+    all_ok = True
+    
+    for dir_name, (status, error) in ensure_directories(directories).items():
+        if status == "failed":
+            print_error(f"Failed to create {dir_name}/")
+            print(f"  Error: {str(error)}")
+            all_ok = False
         else:
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                print_success(f"{dir_name}/ created")
-            except Exception as e:
-                print_error(f"Failed to create {dir_name}/")
-                print(f"  Error: {str(e)}")
-                return False
+            print_success(f"{dir_name}/ {status}")
     
-    return True
+    return all_ok
+
+SETUP_CACHE_FILE = Path(".setup_cache.json")
+
+def _setup_cache_key():
+    """
+    Inputs the cached local checks depend on: requirements, interpreter and .env.
+
+    The executable and prefix identify the venv, so another environment on the same
+    Python version does not reuse its dependency result.
+    """
+    def mtime(name):
+        try:
+            return os.stat(name).st_mtime
+        except OSError:
+            return 0
+    return [mtime("requirements.txt"), sys.version, sys.executable, sys.prefix, mtime(".env")]
+
+def _local_checks_cached(key):
+    """True if the local checks last passed with the same cache key."""
+    try:
+        cache = json.loads(SETUP_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return cache.get("key") == key and cache.get("passed") is True
+
+def _save_setup_cache(key):
+    try:
+        SETUP_CACHE_FILE.write_text(json.dumps({"key": key, "passed": True}), encoding="utf-8")
+    except OSError:
+        pass
 
 def main():
     """Run all checks"""
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}  Financial AI Agent - Setup Verification{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}")
-    
+    parser = argparse.ArgumentParser(description="Check the financial agent setup.")
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="also send a 5-token chat completion to the Azure deployment",
+    )
+    parser.add_argument(
+        "--force-network",
+        action="store_true",
+        help="run the network checks even when a local check failed",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print one JSON report instead of the colored output",
+    )
+    args = parser.parse_args()
+    echo = not args.json
+    
+    if echo:
+        print(f"\n{BLUE}{'='*60}{RESET}")
+        print(f"{BLUE}  Financial AI Agent - Setup Verification{RESET}")
+        print(f"{BLUE}{'='*60}{RESET}")
+    
+    # Cheap local checks run first; the network tier only runs if they all pass
     checks = [
         ("Python Version", check_python_version),
         ("Dependencies", check_dependencies),
@@ -263,33 +446,84 @@ def main():
         ("Environment Variables", check_env_variables),
         ("Required Files", check_files),
         ("Storage Directories", check_directories),
-        ("Azure OpenAI Connection", check_azure_openai_connection),
+    ]
+    
+    # Network probes are I/O bound, so they run concurrently after the local checks
+    network_checks = [
+        ("Azure OpenAI Connection", functools.partial(check_azure_openai_connection, deep=args.deep)),
         ("FMP API Connection", check_fmp_api),
     ]
     
+    # (name, True | False | None for skipped, captured output)
     results = []
     
+    # Variables come from the current shell, not from files, so they are always re-checked
+    uncached = {"Environment Variables"}
+    cache_key = _setup_cache_key()
+    cached = _local_checks_cached(cache_key)
+    if cached and echo:
+        print_header("Local Checks")
     for name, check_func in checks:
+        if cached and name not in uncached:
+            if echo:
+                print_success(f"{name}: cached PASS")
+            results.append((name, True, "cached PASS"))
+            continue
+        out = io.StringIO()
         try:
-            result = check_func()
-            results.append((name, result))
+            with contextlib.redirect_stdout(out):
+                result = check_func()
         except Exception as e:
-            print_error(f"Error running {name} check: {e}")
-            results.append((name, False))
+            print_error(f"Error running {name} check: {e}", file=out)
+            result = False
+        if echo:
+            sys.stdout.write(out.getvalue())
+        results.append((name, result, out.getvalue()))
+    if not cached and all(result for name, result, _ in results if name not in uncached):
+        _save_setup_cache(cache_key)
+    
+    if args.force_network or all(result for _, result, _ in results):
+        results.extend(asyncio.run(run_network_checks(network_checks, echo=echo)))
+    else:
+        results.extend((name, None, "skipped: a local check failed") for name, _ in network_checks)
+    
+    passed = sum(1 for _, result, _ in results if result)
+    skipped = sum(1 for _, result, _ in results if result is None)
+    total = len(results) - skipped
+    ok = passed == total and not skipped
+    
+    if args.json:
+        print(json.dumps({
+            "checks": [
+                {
+                    "name": name,
+                    "passed": result,
+                    "skipped": result is None,
+                    "detail": _ANSI_RE.sub("", detail).strip(),
+                }
+                for name, result, detail in results
+            ],
+            "passed": passed,
+            "total": total,
+            "skipped": skipped,
+        }, ensure_ascii=False))
+        return 0 if ok else 1
     
     # Summary
     print_header("Summary")
     
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    
-    for name, result in results:
-        status = f"{GREEN}PASS{RESET}" if result else f"{RED}FAIL{RESET}"
+    for name, result, _ in results:
+        if result is None:
+            status = f"{YELLOW}SKIPPED{RESET}"
+        else:
+            status = f"{GREEN}PASS{RESET}" if result else f"{RED}FAIL{RESET}"
         print(f"  {name:.<40} {status}")
     
     print(f"\n  Checks passed: {passed}/{total}")
+    if skipped:
+        print(f"  Network checks skipped: {skipped} (fix the failures above or pass --force-network)")
     
-    if passed == total:
+    if ok:
         print(f"\n{GREEN}{'='*60}{RESET}")
         print(f"{GREEN}  ✓ All checks passed! You're ready to go!{RESET}")
         print(f"{GREEN}{'='*60}{RESET}")
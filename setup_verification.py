@@ -3,16 +3,25 @@
 Enhanced Financial AI Agent System - Complete Setup & Verification
 """
 
+import argparse
+import io
 import sys
-import os
-from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Set, TextIO, Tuple
 
-def print_header(text: str) -> None:
+from _setup_common import (
+    ENV_FILE,
+    cwd_entries,
+    ensure_directories,
+    ensure_env,
+    env_value,
+    find_packages,
+    path_for,
+    python_version,
+)
+
+def print_header(text: str, file: Optional[TextIO] = None) -> None:
     """Print formatted header."""
-    print(f"\n{'='*70}")
-    print(f"  {text}")
-    print(f"{'='*70}")
+    print(f"\n{'='*70}\n  {text}\n{'='*70}", file=file)
 
 def print_section(text: str) -> None:
     """Print section header."""
@@ -20,19 +29,18 @@ def print_section(text: str) -> None:
 
 def check_python_version() -> bool:
     """Check if Python version is 3.10 or higher."""
-    version = sys.version_info
-    meets_requirement = version >= (3, 10)
+    meets_requirement, version = python_version()
     
     if meets_requirement:
-        print(f"✅ Python {version.major}.{version.minor}.{version.micro}")
+        print(f"✅ Python {version}")
     else:
-        print(f"❌ Python {version.major}.{version.minor}.{version.micro} (Requires 3.10+)")
+        print(f"❌ Python {version} (Requires 3.10+)")
     
     return meets_requirement
 
-def check_file(filename: str, required: bool = True) -> bool:
-    """Check if a file exists."""
-    exists = Path(filename).exists()
+def check_file(filename: str, required: bool = True, present: Optional[Set[str]] = None) -> bool:
+    """Check if a file exists, using a directory listing of the CWD when given."""
+    exists = filename in present if present is not None else path_for(filename).exists()
     status = "✅" if exists else ("❌" if required else "⚠️")
     req_text = "REQUIRED" if required else "Optional"
     print(f"{status} {filename:40s} [{req_text}]")
@@ -48,12 +56,14 @@ def check_files() -> Tuple[int, int, int]:
         "tools_enhanced.py",
         "financial_agents.py",
         "magentic_agent_enhanced.py",
+        "mcp_tool_pool.py",
         "init_agent.py",
         "entity_agent.py",
         "fetch_news.py",
         "sentiment_agent.py",
         "inspector_agent.py",
         "orchestrator_decision_agent.py",
+        "prompts.py",
     ]
     
     optional_files = [
@@ -62,8 +72,17 @@ def check_files() -> Tuple[int, int, int]:
         "requirements.txt",
     ]
     
-    required_found = sum(check_file(f, required=True) for f in required_files)
-    optional_found = sum(check_file(f, required=False) for f in optional_files)
+    all_files = [(name, True) for name in required_files] + [(name, False) for name in optional_files]
+    
+    # One directory listing and one pass over required and optional files
+    present = cwd_entries()
+    required_found = optional_found = 0
+    for name, required in all_files:
+        if check_file(name, required=required, present=present):
+            if required:
+                required_found += 1
+            else:
+                optional_found += 1
     
     return required_found, len(required_files), optional_found
 
@@ -77,17 +96,19 @@ def check_dependencies() -> Tuple[List[str], List[str]]:
         "dotenv": "python-dotenv",
         "fastmcp": "fastmcp",
         "pydantic": "pydantic",
+        "orjson": "orjson",
+        "cachetools": "cachetools",
+        "httpx": "httpx",
     }
     
     installed = []
     missing = []
     
-    for module_name, package_name in packages.items():
-        try:
-            __import__(module_name)
+    for package_name, found in zip(packages.values(), find_packages(packages)):
+        if found:
             print(f"✅ {package_name}")
             installed.append(package_name)
-        except ImportError:
+        else:
             print(f"❌ {package_name}")
             missing.append(package_name)
     
@@ -110,23 +131,23 @@ def check_env_file() -> Tuple[List[str], List[str]]:
         "FINANCE_STATE_DIR",
         "FINANCE_ARTICLES_DIR",
         "FINANCIAL_DATA_DIR",
+        "FINANCE_CACHE_DIR",
+        "FINPIPE_LOG",
     ]
     
-    if not Path(".env").exists():
+    if not ENV_FILE.exists():
         print("❌ .env file not found")
         print("\n💡 Create .env file from .env.example:")
         print("   cp .env.example .env")
         return [], required_vars
     
-    from dotenv import load_dotenv
-    load_dotenv()
+    ensure_env()
     
     configured = []
     missing = []
     
     for var in required_vars:
-        value = os.getenv(var)
-        if value and value.strip():
+        if env_value(var) is not None:
             print(f"✅ {var}")
             configured.append(var)
         else:
@@ -135,8 +156,8 @@ def check_env_file() -> Tuple[List[str], List[str]]:
     
     print("\nOptional Variables:")
     for var in optional_vars:
-        value = os.getenv(var)
-        if value and value.strip():
+        value = env_value(var)
+        if value is not None:
             print(f"✅ {var} = {value}")
         else:
             print(f"⚠️  {var} (using default)")
@@ -153,14 +174,14 @@ def check_directories() -> None:
         "financial_data": "Financial data cache",
     }
     
-    for dir_name, description in dirs.items():
-        dir_path = Path(dir_name)
-        if dir_path.exists():
+    for dir_name, (status, error) in ensure_directories(dirs).items():
+        description = dirs[dir_name]
+        if status == "exists":
             print(f"✅ {dir_name:20s} - {description}")
+        elif status == "created":
+            print(f"⚠️  {dir_name:20s} - Created: {path_for(dir_name).absolute()}")
         else:
-            print(f"⚠️  {dir_name:20s} - Creating...")
-            dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"   Created: {dir_path.absolute()}")
+            print(f"❌ {dir_name:20s} - Could not create: {error}")
 
 def test_imports() -> bool:
     """Test if all modules can be imported."""
@@ -171,12 +192,14 @@ def test_imports() -> bool:
         "chat_client_factory",
         "tools_enhanced",
         "financial_agents",
+        "mcp_tool_pool",
         "init_agent",
         "entity_agent",
         "fetch_news",
         "sentiment_agent",
         "inspector_agent",
         "orchestrator_decision_agent",
+        "prompts",
     ]
     
     success = True
@@ -200,84 +223,102 @@ def print_summary(
     env_missing: List[str],
 ) -> None:
     """Print setup summary."""
-    print_header("Setup Summary")
+    buf = io.StringIO()
+    print_header("Setup Summary", file=buf)
     
     total_checks = 4
     passed_checks = 0
     
     # Python version
     if python_ok:
-        print("✅ Python Version: Compatible")
+        print("✅ Python Version: Compatible", file=buf)
         passed_checks += 1
     else:
-        print("❌ Python Version: Upgrade to 3.10+")
+        print("❌ Python Version: Upgrade to 3.10+", file=buf)
     
     # Files
     if files_found == files_required:
-        print(f"✅ Files: All required files present ({files_found}/{files_required})")
+        print(f"✅ Files: All required files present ({files_found}/{files_required})", file=buf)
         passed_checks += 1
     else:
-        print(f"❌ Files: Missing {files_required - files_found} required files")
+        print(f"❌ Files: Missing {files_required - files_found} required files", file=buf)
     
     # Dependencies
     if not deps_missing:
-        print(f"✅ Dependencies: All installed ({len(deps_installed)})")
+        print(f"✅ Dependencies: All installed ({len(deps_installed)})", file=buf)
         passed_checks += 1
     else:
-        print(f"❌ Dependencies: {len(deps_missing)} missing")
+        print(f"❌ Dependencies: {len(deps_missing)} missing", file=buf)
     
     # Environment
     if not env_missing:
-        print(f"✅ Environment: Fully configured")
+        print(f"✅ Environment: Fully configured", file=buf)
         passed_checks += 1
     else:
-        print(f"❌ Environment: {len(env_missing)} variables missing")
+        print(f"❌ Environment: {len(env_missing)} variables missing", file=buf)
     
-    print(f"\n📊 Score: {passed_checks}/{total_checks} checks passed")
+    print(f"\n📊 Score: {passed_checks}/{total_checks} checks passed", file=buf)
     
     if passed_checks == total_checks:
-        print("\n🎉 Setup Complete! Ready to run the financial agent system.")
+        print("\n🎉 Setup Complete! Ready to run the financial agent system.", file=buf)
     else:
-        print("\n⚠️  Setup Incomplete. Follow instructions below.")
+        print("\n⚠️  Setup Incomplete. Follow instructions below.", file=buf)
+    
+    # One write for the whole block instead of one per line
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 def print_next_steps(
     deps_missing: List[str],
     env_missing: List[str],
 ) -> None:
     """Print next steps for incomplete setup."""
-    print_header("Next Steps")
+    buf = io.StringIO()
+    print_header("Next Steps", file=buf)
     
     if deps_missing:
-        print("\n1️⃣  Install Missing Dependencies:")
-        print("   pip install -r requirements.txt")
-        print("\n   Or install individually:")
+        print("\n1️⃣  Install Missing Dependencies:", file=buf)
+        print("   pip install -r requirements.txt", file=buf)
+        print("\n   Or install individually:", file=buf)
         for pkg in deps_missing:
-            print(f"   pip install {pkg}")
+            print(f"   pip install {pkg}", file=buf)
     
     if env_missing:
-        print("\n2️⃣  Configure Environment:")
-        print("   a) Copy example config:")
-        print("      cp .env.example .env")
-        print("\n   b) Edit .env and add your API keys:")
-        print("      nano .env")
-        print("\n   Required keys:")
+        print("\n2️⃣  Configure Environment:", file=buf)
+        print("   a) Copy example config:", file=buf)
+        print("      cp .env.example .env", file=buf)
+        print("\n   b) Edit .env and add your API keys:", file=buf)
+        print("      nano .env", file=buf)
+        print("\n   Required keys:", file=buf)
         for var in env_missing:
-            print(f"      - {var}")
-        print("\n   Get API keys:")
-        print("      - Azure OpenAI: https://portal.azure.com")
-        print("      - FMP API: https://financialmodelingprep.com/developer/docs/")
-    
-    print("\n3️⃣  Test the Setup:")
-    print("   python magentic_agent_enhanced.py")
-    
-    print("\n4️⃣  Read Documentation:")
-    print("   - README.md - Project overview")
-    print("   - QUICKSTART_GUIDE.md - Usage examples")
-    print("   - AZURE_MODEL_GUIDE.md - Model selection")
-    print("   - ENHANCED_SYSTEM_DOCUMENTATION.md - Full docs")
+            print(f"      - {var}", file=buf)
+        print("\n   Get API keys:", file=buf)
+        print("      - Azure OpenAI: https://portal.azure.com", file=buf)
+        print("      - FMP API: https://financialmodelingprep.com/developer/docs/", file=buf)
+    
+    print("\n3️⃣  Test the Setup:", file=buf)
+    print("   python magentic_agent_enhanced.py", file=buf)
+    
+    print("\n4️⃣  Read Documentation:", file=buf)
+    print("   - README.md - Project overview", file=buf)
+    print("   - QUICKSTART_GUIDE.md - Usage examples", file=buf)
+    print("   - AZURE_MODEL_GUIDE.md - Model selection", file=buf)
+    print("   - ENHANCED_SYSTEM_DOCUMENTATION.md - Full docs", file=buf)
+    
+    # One write for the whole block instead of one per line
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 def main() -> None:
     """Main setup verification."""
+    parser = argparse.ArgumentParser(description="Verify the financial agent setup.")
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="also import every project module (slower, catches import-time errors)",
+    )
+    args = parser.parse_args()
+    
     print_header("Enhanced Financial AI Agent System - Setup Verification")
     
     # Check Python version
@@ -308,7 +349,7 @@ def main() -> None:
         print(f"❌ Error with directories: {e}")
     
     # Test imports
-    if not deps_missing:
+    if args.deep and not deps_missing:
         try:
             test_imports()
         except Exception as e:
@@ -0,0 +1,86 @@
+"""Round-trip tests for the NDJSON financial data log in tools_enhanced."""
+
+import asyncio
+
+import orjson
+import pytest
+
+import tools_enhanced as te
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(te, "FINANCIAL_DATA_DIR", tmp_path)
+    te._financial_data_log.cache_clear()
+    te._financial_data_path.cache_clear()
+    yield tmp_path
+    te._financial_data_log.cache_clear()
+    te._financial_data_path.cache_clear()
+
+
+def _load(guid, data_type):
+    return orjson.loads(te.financial_data_load(guid, data_type))
+
+
+def _load_all(guid):
+    return orjson.loads(te.financial_data_load_all(guid))
+
+
+def test_round_trip(data_dir):
+    te._append_financial_data("g", {"prices": [{"close": 1.5}], "ratios": {"pe": 20}})
+
+    assert _load("g", "prices") == [{"close": 1.5}]
+    assert _load("g", "ratios") == {"pe": 20}
+    assert _load_all("g") == {"guid": "g", "data": {"prices": [{"close": 1.5}], "ratios": {"pe": 20}}}
+
+
+def test_later_record_supersedes(data_dir):
+    te._write_financial_data("g", "prices", [1])
+    te._write_financial_data("g", "ratios", {"pe": 1})
+    te._write_financial_data("g", "prices", [2])
+
+    assert _load("g", "prices") == [2]
+    assert _load_all("g")["data"] == {"prices": [2], "ratios": {"pe": 1}}
+
+
+def test_missing_type(data_dir):
+    te._write_financial_data("g", "prices", [1])
+
+    assert "error" in _load("g", "ratios")
+    assert "error" in _load_all("other")
+
+
+def test_torn_last_line_is_skipped(data_dir):
+    te._write_financial_data("g", "prices", [1, 2])
+    with open(te._financial_data_log("g"), "ab") as f:
+        f.write(b'{"type":"prices","data":[9,9')
+
+    assert _load("g", "prices") == [1, 2]
+    assert _load_all("g")["data"] == {"prices": [1, 2]}
+
+
+def test_append_after_torn_line_starts_a_new_line(data_dir):
+    te._write_financial_data("g", "prices", [1, 2])
+    with open(te._financial_data_log("g"), "ab") as f:
+        f.write(b'{"type":"prices","data":[9,9')
+    te._write_financial_data("g", "ratios", {"pe": 3})
+
+    assert _load("g", "ratios") == {"pe": 3}
+    assert _load("g", "prices") == [1, 2]
+    # The response is spliced from raw record bytes, so it must still parse
+    assert _load_all("g")["data"] == {"prices": [1, 2], "ratios": {"pe": 3}}
+
+
+def test_fmp_batch_with_guid_stores_prices_and_summarizes_bulk(data_dir, monkeypatch):
+    bars = [{"date": "2024-01-02", "close": 1.0}, {"date": "2024-01-01", "close": 2.0}]
+    monkeypatch.setitem(te.FMP_BATCH_ENDPOINTS, "profile", lambda t: te._dumps({"symbol": t, "beta": 1.1}))
+    monkeypatch.setitem(
+        te.FMP_BATCH_ENDPOINTS, "historical", lambda t: te._dumps({"symbol": t, "historical": bars})
+    )
+
+    out = orjson.loads(asyncio.run(te.fmp_batch("aapl", ["profile", "historical"], guid="g")))
+
+    assert out["results"]["profile"] == {"symbol": "aapl", "beta": 1.1}
+    assert out["results"]["historical"] == {"data_type": "prices", "items": 2}
+    assert _load("g", "prices") == bars
+    assert "error" in _load("g", "historical")
@@ -1,29 +1,100 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import inspect
+import mmap
+import operator
 import os
 import re
+import tempfile
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
 import requests
+from cachetools import LRUCache, TTLCache
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from dotenv import load_dotenv
 
+try:
+    import simdjson  # optional: lazy parsing of large Alpha Vantage responses
+except ImportError:
+    simdjson = None
+
+try:
+    from fastnumbers import try_float  # optional: C-level numeric coercion
+except ImportError:
+    try_float = None
+
+try:
+    import fcntl  # POSIX only: serializes appends to the financial data log
+except ImportError:
+    fcntl = None
+
 # Load environment variables immediately to ensure subprocess sees them
 load_dotenv()
 
-mcp = FastMCP("finance_tools")
+@contextlib.asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Warm the Alpha Vantage connection while the server starts; close the client on exit."""
+    warm_up = asyncio.create_task(_av_warm_up())
+    try:
+        yield
+    finally:
+        warm_up.cancel()
+        await _AV_ACLIENT.aclose()
+
+mcp = FastMCP("finance_tools", lifespan=_lifespan)
 FMP_BASE_URL = "https://financialmodelingprep.com"
 
+ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
+
+# One pooled session for every outbound HTTP call, so repeated and concurrent
+# (fmp_batch) tool calls reuse TCP/TLS connections instead of reconnecting.
+# The API hosts also retry rate-limit and transient 5xx responses with backoff.
+_RETRY_STATUSES = [429, 500, 502, 503, 504]
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_HTTP.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_HTTP.mount(FMP_BASE_URL, HTTPAdapter(
+    pool_connections=10, pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=_RETRY_STATUSES),
+))
+atexit.register(_HTTP.close)
+
+# Alpha Vantage tools are async, so parallel tool calls from an agent wait on sockets
+# instead of each holding a thread. HTTP/2 multiplexes them over one connection when
+# the optional h2 package is installed (httpx[http2]).
+_AV_ACLIENT = httpx.AsyncClient(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+    timeout=30,
+)
+
 # ----------------------------
 # Models + local state store
 # ----------------------------
 
 class Finance(BaseModel):
+    # Agents often echo extra keys ("stored", "error", ...), so those are dropped, not
+    # rejected. Assignment is never validated implicitly: finance_save calls
+    # validate_assignment itself for changed fields only. The schema is built at import.
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, defer_build=False)
+
     prompt: Optional[str] = Field(default=None)
     guid: Optional[str] = Field(default=None)
     ticker: Optional[str] = Field(default=None)
@@ -47,6 +118,9 @@ class Finance(BaseModel):
     industry: Optional[str] = Field(default=None)
     exchange: Optional[str] = Field(default=None)
 
+# Built once at import so every validation reuses the compiled core schema
+_FINANCE_ADAPTER = TypeAdapter(Finance)
+
 STATE_DIR = Path(os.getenv("FINANCE_STATE_DIR", "agent_state"))
 STATE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -56,83 +130,369 @@ ARTICLES_DIR.mkdir(parents=True, exist_ok=True)
 FINANCIAL_DATA_DIR = Path(os.getenv("FINANCIAL_DATA_DIR", "financial_data"))
 FINANCIAL_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+CACHE_DIR = Path(os.getenv("FINANCE_CACHE_DIR", ".cache"))
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Response cache lifetimes (seconds), matched to how often the upstream data changes
+TTL_QUOTE = 60
+TTL_DAILY = 24 * 3600
+TTL_WEEKLY = 7 * 24 * 3600
+TTL_MONTHLY = 30 * 24 * 3600
+TTL_QUARTERLY = 90 * 24 * 3600
+
 # ----------------------------
 # Helpers
 # ----------------------------
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_ANY_RE = re.compile(r"(\{.*\}|\[.*\])", re.DOTALL)
+_SYMBOL_SPLIT_RE = re.compile(r"[,\s]+", re.ASCII)
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a tool response; orjson emits UTF-8 directly, with no ensure_ascii escaping pass.
+    NumPy arrays (columnar time series) are written straight from their buffers.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+
+_loads = orjson.loads
+
 def _extract_json_obj(text: str) -> Dict[str, Any]:
-    text = (text or "").strip()
-    if text.startswith("{") and text.endswith("}"):
-        return json.loads(text)
-    m = re.search(r"\{.*\}", text, flags=re.DOTALL)
+    if not text:
+        raise ValueError("No JSON object found.")
+    # Tool arguments are nearly always clean JSON, and orjson skips surrounding
+    # whitespace itself, so try a direct parse before any strip or regex scan
+    try:
+        data = _loads(text)
+        if isinstance(data, dict):
+            return data
+    except ValueError:
+        pass
+    m = _JSON_OBJ_RE.search(text)
     if not m:
         raise ValueError("No JSON object found.")
-    return json.loads(m.group(0))
+    return _loads(m.group(0))
 
 def _extract_json_any(text: str) -> Any:
-    text = (text or "").strip()
-    if (text.startswith("{") and text.endswith("}")) or (text.startswith("[") and text.endswith("]")):
-        return json.loads(text)
-    m = re.search(r"(\{.*\}|\[.*\])", text, flags=re.DOTALL)
+    if not text:
+        raise ValueError("No JSON object/array found.")
+    try:
+        data = _loads(text)
+        if isinstance(data, (dict, list)):
+            return data
+    except ValueError:
+        pass
+    m = _JSON_ANY_RE.search(text)
     if not m:
         raise ValueError("No JSON object/array found.")
-    return json.loads(m.group(0))
+    return _loads(m.group(0))
+
+# (UTC day number, today, one year ago); replaced as a whole tuple so threads never see a mix
+_DAY_STRINGS: Tuple[int, str, str] = (-1, "", "")
+
+def _utc_dates() -> Tuple[str, str]:
+    """Return (today, one year ago) as UTC YYYY-MM-DD strings, formatted once per UTC day."""
+    global _DAY_STRINGS
+    day = int(time.time() // 86400)
+    cached = _DAY_STRINGS
+    if cached[0] != day:
+        today = datetime.fromtimestamp(day * 86400, timezone.utc).date()
+        cached = _DAY_STRINGS = (day, today.isoformat(), (today - timedelta(days=365)).isoformat())
+    return cached[1], cached[2]
 
 def _normalize_symbols(symbols: str) -> List[str]:
     if not symbols:
         return []
-    parts = re.split(r"[,\s]+", symbols.strip())
-    out: List[str] = []
-    seen = set()
-    for p in parts:
-        s = p.strip().upper()
-        if s and s not in seen:
-            seen.add(s)
-            out.append(s)
-    return out
+    # One C-level upper() over the whole string, then an order-preserving dedupe
+    parts = _SYMBOL_SPLIT_RE.split(symbols.upper().strip())
+    return list(dict.fromkeys(p for p in parts if p))
 
 def _group_articles_by_symbol(articles: List[Dict[str, Any]], requested: List[str]) -> Dict[str, List[Dict[str, Any]]]:
     grouped: Dict[str, List[Dict[str, Any]]] = {s: [] for s in requested}
+    # requested is already upper-cased by _normalize_symbols
+    requested_set = frozenset(requested)
+    bucket = grouped.__getitem__
     for item in articles:
-        item_symbols = item.get("symbols") or item.get("symbol")
-        if isinstance(item_symbols, list):
-            for sym in item_symbols:
-                su = str(sym).upper()
-                if su in grouped:
-                    grouped[su].append(item)
-        elif isinstance(item_symbols, str):
-            su = item_symbols.upper()
-            if su in grouped:
-                grouped[su].append(item)
+        syms = item.get("symbols") or item.get("symbol") or ()
+        if isinstance(syms, str):
+            syms = (syms,)
+        for sym in syms:
+            su = str(sym).upper()
+            if su in requested_set:
+                bucket(su).append(item)
     return grouped
 
+def _is_error_response(payload: str) -> bool:
+    try:
+        data = _loads(payload)
+    except ValueError:
+        return True
+    return isinstance(data, dict) and "error" in data
+
+def _cache_key(name: str, params: Dict[str, Any]) -> str:
+    return hashlib.blake2b(
+        orjson.dumps([name, params], option=orjson.OPT_SORT_KEYS, default=str), digest_size=16
+    ).hexdigest()
+
+def _cache_get(key: str, ttl: int) -> Optional[str]:
+    """Return the cached response for key if it is younger than ttl seconds."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Replace path with data in one step. Tool subprocesses and worker threads share
+    CACHE_DIR, so a reader must never see a truncated or half-written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def _cache_put(key: str, value: str) -> None:
+    _atomic_write(CACHE_DIR / f"{key}.json", value.encode("utf-8"))
+
+def _conditional_get(url: str, params: Dict[str, Any], timeout: int = 20) -> bytes:
+    """
+    GET url and return the body, revalidating any stored copy with ETag/Last-Modified.
+
+    A 304 reuses the stored body, so a changed-rarely endpoint costs only the round
+    trip. Bodies are kept only when the server sent a validator, and the API key is
+    left out of the storage key. The validators and the body they describe share one
+    atomically replaced file (validators JSON, newline, body), so they always match.
+    """
+    key = _cache_key(url, {k: v for k, v in params.items() if k != "apikey"})
+    path = CACHE_DIR / f"{key}.conditional"
+
+    headers: Dict[str, str] = {}
+    body: Optional[bytes] = None
+    try:
+        stored = path.read_bytes()
+        nl = stored.index(b"\n")
+        meta = _loads(stored[:nl])
+        body = stored[nl + 1:]
+    except (OSError, ValueError):
+        meta = {}
+    if body is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    r = _HTTP.get(url, params=params, headers=headers, timeout=timeout)
+    if r.status_code == 304 and body is not None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return body
+    r.raise_for_status()
+
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if etag or last_modified:
+        _atomic_write(path, orjson.dumps({"etag": etag, "last_modified": last_modified}) + b"\n" + r.content)
+    return r.content
+
+def _cached(ttl: int):
+    """
+    Cache a tool's JSON response on disk for ttl seconds.
+
+    The key is a BLAKE2b hash of the tool name and its bound arguments, with tickers
+    normalized (the API key is read from the environment, so it never enters the key).
+    Error responses are never stored, and force_refresh=True skips the lookup and
+    refreshes the entry.
+    """
+    def decorator(fn):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            force_refresh = params.pop("force_refresh", False)
+            # Tickers are case-insensitive upstream, so "aapl" and "AAPL" share one entry
+            if isinstance(params.get("symbol"), str):
+                params["symbol"] = _sym(params["symbol"])
+            if isinstance(params.get("symbols"), str):
+                params["symbols"] = ",".join(_normalize_symbols(params["symbols"]))
+            key = _cache_key(fn.__name__, params)
+
+            if not force_refresh:
+                cached = _cache_get(key, ttl)
+                if cached is not None:
+                    return cached
+
+            result = fn(*args, **kwargs)
+            if not _is_error_response(result):
+                _cache_put(key, result)
+            return result
+
+        return wrapper
+    return decorator
+
+# Path objects are immutable, so each guid's paths are built once and reused
+@functools.lru_cache(maxsize=256)
 def _articles_path(guid: str) -> Path:
     return ARTICLES_DIR / f"{guid}_articles.json"
 
+@functools.lru_cache(maxsize=256)
 def _financial_data_path(guid: str, data_type: str) -> Path:
+    """Legacy one-file-per-type location, still read as a fallback."""
     return FINANCIAL_DATA_DIR / f"{guid}_{data_type}.json"
 
+@functools.lru_cache(maxsize=256)
+def _financial_data_log(guid: str) -> Path:
+    return FINANCIAL_DATA_DIR / f"{guid}.ndjson"
+
+# Each NDJSON line is {"type":<data_type>,"data":<data>,"ts":<epoch>} with keys in
+# that order, so a record can be located by its prefix and the data sliced out raw.
+_NDJSON_TYPE_PREFIX = b'{"type":'
+_NDJSON_DATA_SEP = b',"data":'
+_NDJSON_TS_SEP = b',"ts":'
+# A complete record ends with its ts field; a line torn by a crash mid-append does not
+_NDJSON_TS_TAIL_RE = re.compile(rb',"ts":-?[0-9][0-9.eE+-]*\}')
+
+def _append_financial_data(guid: str, entries: Dict[str, Any]) -> Path:
+    """
+    Append one NDJSON record per data_type; later records supersede earlier ones.
+
+    Tool subprocesses and fmp_batch threads share the log, so the whole batch goes out
+    through one O_APPEND fd under an exclusive lock (where fcntl exists). If an earlier
+    append was torn, a newline is written first so the new records start on their own line.
+    """
+    p = _financial_data_log(guid)
+    ts = time.time()
+    payload = b"".join(
+        orjson.dumps({"type": data_type, "data": data, "ts": ts}) + b"\n"
+        for data_type, data in entries.items()
+    )
+    fd = os.open(p, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        if os.lseek(fd, 0, os.SEEK_END) > 0:
+            os.lseek(fd, -1, os.SEEK_END)
+            if os.read(fd, 1) != b"\n":
+                payload = b"\n" + payload
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)  # also releases the lock
+    return p
+
+def _write_financial_data(guid: str, data_type: str, data: Any) -> Path:
+    return _append_financial_data(guid, {data_type: data})
+
+def _read_financial_data_raw(guid: str, data_type: str) -> Optional[bytes]:
+    """Return the JSON bytes of the latest record for data_type, scanning the log from the end."""
+    p = _financial_data_log(guid)
+    try:
+        f = open(p, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            prefix = _NDJSON_TYPE_PREFIX + orjson.dumps(data_type) + _NDJSON_DATA_SEP
+            end = len(mm)
+            while True:
+                pos = mm.rfind(prefix, 0, end)
+                if pos < 0:
+                    return None
+                if pos == 0 or mm[pos - 1] == 0x0A:
+                    # A torn line (crash mid-append) has no newline or no ts tail;
+                    # skip it so an earlier complete record is returned instead
+                    line_end = mm.find(b"\n", pos)
+                    data_end = mm.rfind(_NDJSON_TS_SEP, pos, line_end) if line_end >= 0 else -1
+                    if data_end >= 0 and _NDJSON_TS_TAIL_RE.fullmatch(mm, data_end, line_end):
+                        return mm[pos + len(prefix):data_end]
+                end = pos
+
+def _iter_legacy_financial_files(guid: str):
+    """Yield (data_type, path) for the guid's legacy per-type files, with a plain prefix match."""
+    prefix = f"{guid}_"
+    with os.scandir(FINANCIAL_DATA_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".json"):
+                yield name[len(prefix):-5], entry.path
+
+def _iter_financial_data(guid: str):
+    """Yield (data_type, data_bytes) for every complete record in the log, oldest first."""
+    p = _financial_data_log(guid)
+    if not p.exists():
+        return
+    with open(p, "rb") as f:
+        for line in f:
+            # A torn line (crash mid-append) lacks the newline or the ts tail
+            if not line.endswith(b"\n") or not line.startswith(_NDJSON_TYPE_PREFIX):
+                continue
+            sep = line.find(_NDJSON_DATA_SEP)
+            ts_sep = line.rfind(_NDJSON_TS_SEP)
+            if sep < 0 or ts_sep < sep or not _NDJSON_TS_TAIL_RE.fullmatch(line, ts_sep, len(line) - 1):
+                continue
+            data_type = orjson.loads(line[len(_NDJSON_TYPE_PREFIX):sep])
+            yield data_type, line[sep + len(_NDJSON_DATA_SEP):ts_sep]
+
 # ----------------------------
 # MCP tools: Finance state
 # ----------------------------
 
+@functools.lru_cache(maxsize=256)
+def _state_path(guid: str) -> Path:
+    return STATE_DIR / f"{guid}.json"
+
+def _load_finance(guid: str) -> Optional[Finance]:
+    """
+    Re-hydrate a stored Finance state without validation.
+
+    Only finance_init/finance_save write state files, and both validate first, so
+    internal reads use model_construct; external input always goes through validation.
+    """
+    try:
+        raw = _state_path(guid).read_bytes()
+    except FileNotFoundError:
+        return None
+    return Finance.model_construct(**orjson.loads(raw))
+
+def _write_finance(fin: Finance) -> Path:
+    # orjson emits UTF-8 bytes directly, so there is no str -> bytes re-encode on write
+    path = _state_path(fin.guid)
+    path.write_bytes(orjson.dumps(fin.model_dump(), option=orjson.OPT_INDENT_2))
+    return path
+
 @mcp.tool()
 def finance_init(prompt: str) -> str:
     """Initialize a new Finance state object with a unique GUID."""
     fin = Finance(
         prompt=prompt,
         guid=str(uuid.uuid4()),
-        date=datetime.utcnow().date().isoformat(),
+        date=_utc_dates()[0],
     )
-    path = STATE_DIR / f"{fin.guid}.json"
-    path.write_text(fin.model_dump_json(indent=2), encoding="utf-8")
-    return json.dumps({"guid": fin.guid}, ensure_ascii=False)
+    _write_finance(fin)
+    return _dumps({"guid": fin.guid})
 
 @mcp.tool()
 def finance_load(guid: str) -> str:
     """Load a Finance state object by GUID."""
-    path = STATE_DIR / f"{guid}.json"
+    path = _state_path(guid)
     if not path.exists():
-        return json.dumps({"error": f"No Finance state found for guid={guid}"}, ensure_ascii=False)
+        return _dumps({"error": f"No Finance state found for guid={guid}"})
     return path.read_text(encoding="utf-8")
 
 @mcp.tool()
@@ -140,93 +500,116 @@ def finance_save(finance_json: str) -> str:
     """Save or update a Finance state object."""
     try:
         data = _extract_json_obj(finance_json)
-        fin = Finance.model_validate(data)
+        guid = data.get("guid")
+        stored = _load_finance(guid) if isinstance(guid, str) and guid else None
+
+        if stored is None:
+            fin = _FINANCE_ADAPTER.validate_python(data)
+        else:
+            # Fields identical (same type and value) to the stored, already-validated
+            # state are taken as-is; only the ones the caller changed are validated.
+            fields = Finance.model_fields
+            fin = Finance.model_construct(**{k: v for k, v in data.items() if k in fields})
+            for name, value in data.items():
+                if name not in fields:
+                    continue
+                old = getattr(stored, name, None)
+                if type(old) is not type(value) or old != value:
+                    Finance.__pydantic_validator__.validate_assignment(fin, name, value)
 
         if not fin.guid:
             fin.guid = str(uuid.uuid4())
         if not fin.date:
-            fin.date = datetime.utcnow().date().isoformat()
+            fin.date = _utc_dates()[0]
 
-        path = STATE_DIR / f"{fin.guid}.json"
-        path.write_text(fin.model_dump_json(indent=2), encoding="utf-8")
-        return json.dumps({"guid": fin.guid}, ensure_ascii=False)
+        # An agent re-emitting the state it just loaded changes nothing, so skip the write
+        if stored is None or fin != stored:
+            _write_finance(fin)
+        return _dumps({"guid": fin.guid})
     except Exception as e:
-         return json.dumps({"error": str(e)}, ensure_ascii=False)
+         return _dumps({"error": str(e)})
 
 # ----------------------------
 # MCP tools: FinancialModelingPrep (FMP) API
 # ----------------------------
 
+# The environment is loaded once at import (load_dotenv above), so the keys are read once
+@functools.lru_cache(maxsize=1)
 def _fmp_key() -> Optional[str]:
     """Retrieve FMP API key from environment."""
     return os.getenv("FMP_API_KEY")
 
+@functools.lru_cache(maxsize=1)
 def _alpha_vantage_key() -> Optional[str]:
     """Retrieve Alpha Vantage API key from environment."""
     return os.getenv("ALPHA_VANTAGE_API_KEY")
 
-ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
+# Agents repeat the same handful of tickers, so a hit is one dict lookup and no new strings
+@functools.lru_cache(maxsize=4096)
+def _sym(symbol: str) -> str:
+    # strip first, so upper() runs over the shorter string
+    return symbol.strip().upper()
+
+def _fmp_params(symbol: str, **extras: Any) -> Dict[str, Any]:
+    """Query params for a single-symbol FMP endpoint, with the API key injected."""
+    return {"symbol": _sym(symbol), **extras, "apikey": _fmp_key()}
 
 @mcp.tool()
 def fmp_healthcheck(symbol: str = "AAPL") -> str:
     """Check if FMP API is accessible and responding."""
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"ok": False, "error": "FMP_API_KEY not set in environment"}, ensure_ascii=False)
+        return _dumps({"ok": False, "error": "FMP_API_KEY not set in environment"})
 
     url = f"{FMP_BASE_URL}/stable/quote"
-    params = {"symbol": symbol.upper().strip(), "apikey": api_key}
+    params = _fmp_params(symbol)
     try:
-        r = requests.get(url, params=params, timeout=20)
-        return json.dumps(
-            {"ok": r.status_code == 200, "status_code": r.status_code},
-            ensure_ascii=False
+        r = _HTTP.get(url, params=params, timeout=20)
+        return _dumps(
+            {"ok": r.status_code == 200, "status_code": r.status_code}
         )
     except Exception as e:
-        return json.dumps({"ok": False, "error": str(e)}, ensure_ascii=False)
+        return _dumps({"ok": False, "error": str(e)})
 
 @mcp.tool()
-def fmp_get_profile(symbol: str) -> str:
+@_cached(ttl=TTL_MONTHLY)
+def fmp_get_profile(symbol: str, force_refresh: bool = False) -> str:
     """
     Get complete company profile from FMP API.
     Returns: price, marketCap, description, isin, industry, sector, etc.
+    Cached for 30 days; pass force_refresh=True to bypass the cache.
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/profile"
-    params = {
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
+        data = _loads(_conditional_get(url, params, timeout=20))
         
         if isinstance(data, list) and len(data) > 0:
-            return json.dumps(data[0], ensure_ascii=False)
-        return json.dumps({"error": f"No profile found for {symbol}"})
+            return _dumps(data[0])
+        return _dumps({"error": f"No profile found for {symbol}"})
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
 def fmp_search_symbol(query: str, limit: int = 5) -> str:
     """Search for stock symbols by company name or ticker."""
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"query": query, "results": [], "error": "FMP_API_KEY not set"}, ensure_ascii=False)
+        return _dumps({"query": query, "results": [], "error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/search-symbol"
     params = {"query": query, "limit": int(limit), "apikey": api_key}
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
 
-        data = r.json()
+        data = _loads(r.content)
         items = data if isinstance(data, list) else []
 
         out = []
@@ -239,89 +622,92 @@ def fmp_search_symbol(query: str, limit: int = 5) -> str:
                 "type": it.get("type"),
             })
 
-        return json.dumps({"query": query, "results": out}, ensure_ascii=False)
+        return _dumps({"query": query, "results": out})
     except Exception as e:
-        return json.dumps({"query": query, "results": [], "error": str(e)}, ensure_ascii=False)
+        return _dumps({"query": query, "results": [], "error": str(e)})
+
+# Fields kept from an FMP quote, shared by fmp_quote and fmp_quotes_batch
+_QUOTE_FIELDS = (
+    "symbol", "name", "price", "currency", "marketCap", "changePercentage", "change",
+    "dayLow", "dayHigh", "yearLow", "yearHigh", "volume", "avgVolume", "open",
+    "previousClose", "eps", "pe",
+)
+
+def _quote_fields(q: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: q.get(k) for k in _QUOTE_FIELDS}
 
 @mcp.tool()
-def fmp_quote(symbol: str) -> str:
-    """Get real-time quote for a stock symbol."""
+@_cached(ttl=TTL_QUOTE)
+def fmp_quote(symbol: str, force_refresh: bool = False) -> str:
+    """Get real-time quote for a stock symbol. Cached for 60 seconds; force_refresh=True bypasses the cache."""
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"symbol": symbol, "error": "FMP_API_KEY not set"}, ensure_ascii=False)
+        return _dumps({"symbol": symbol, "error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/quote"
-    params = {"symbol": symbol.upper().strip(), "apikey": api_key}
+    params = _fmp_params(symbol)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
 
-        data = r.json()
+        data = _loads(r.content)
         q = (data[0] if isinstance(data, list) and data else {}) or {}
 
         if not q:
-             return json.dumps({"symbol": symbol, "error": "Symbol not found or API error"}, ensure_ascii=False)
-
-        out = {
-            "symbol": q.get("symbol"),
-            "name": q.get("name"),
-            "price": q.get("price"),
-            "currency": q.get("currency"),
-            "marketCap": q.get("marketCap"),
-            "changePercentage": q.get("changePercentage"),
-            "change": q.get("change"),
-            "dayLow": q.get("dayLow"),
-            "dayHigh": q.get("dayHigh"),
-            "yearLow": q.get("yearLow"),
-            "yearHigh": q.get("yearHigh"),
-            "volume": q.get("volume"),
-            "avgVolume": q.get("avgVolume"),
-            "open": q.get("open"),
-            "previousClose": q.get("previousClose"),
-            "eps": q.get("eps"),
-            "pe": q.get("pe"),
-        }
-        return json.dumps(out, ensure_ascii=False)
+             return _dumps({"symbol": symbol, "error": "Symbol not found or API error"})
+
+        return _dumps(_quote_fields(q))
     except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)}, ensure_ascii=False)
+        return _dumps({"symbol": symbol, "error": str(e)})
 
 @mcp.tool()
-def fmp_stock_news(symbols: str, limit: int = 20, page: int = 0) -> str:
-    """Fetch stock news for given symbols from FMP API."""
+@_cached(ttl=TTL_WEEKLY)
+def fmp_stock_news(
+    symbols: str,
+    limit: int = 20,
+    page: int = 0,
+    force_refresh: bool = False,
+    include_raw: bool = False,
+) -> str:
+    """
+    Fetch stock news for given symbols from FMP API, grouped by symbol.
+    Cached for 7 days; force_refresh=True bypasses the cache.
+    include_raw=True also returns the ungrouped article list as "raw".
+    """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"symbols": [], "articles_by_symbol": {}, "error": "FMP_API_KEY not set"}, ensure_ascii=False)
+        return _dumps({"symbols": [], "articles_by_symbol": {}, "error": "FMP_API_KEY not set"})
 
     sym_list = _normalize_symbols(symbols)
     if not sym_list:
-        return json.dumps({"error": "No symbols provided"}, ensure_ascii=False)
+        return _dumps({"error": "No symbols provided"})
 
     url = f"{FMP_BASE_URL}/stable/stock_news"
     params = {"symbols": ",".join(sym_list), "limit": int(limit), "page": int(page), "apikey": api_key}
 
     try:
-        r = requests.get(url, params=params, timeout=30)
+        r = _HTTP.get(url, params=params, timeout=30)
         r.raise_for_status()
 
-        data = r.json()
+        data = _loads(r.content)
         articles = data if isinstance(data, list) else []
         grouped = _group_articles_by_symbol(articles, sym_list)
 
-        return json.dumps(
-            {"symbols": sym_list, "article_count": len(articles),
-             "articles_by_symbol": grouped, "raw": articles},
-            ensure_ascii=False
-        )
+        out = {"symbols": sym_list, "article_count": len(articles), "articles_by_symbol": grouped}
+        if include_raw:
+            out["raw"] = articles
+        return _dumps(out)
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)})
 
 # ----------------------------
 # NEW: Enhanced Financial Data Tools
 # ----------------------------
 
 @mcp.tool()
-def fmp_get_financials(symbol: str, period: str = "annual", limit: int = 5) -> str:
+@_cached(ttl=TTL_QUARTERLY)
+def fmp_get_financials(symbol: str, period: str = "annual", limit: int = 5, force_refresh: bool = False) -> str:
     """
     Get financial statements (income statement, balance sheet, cash flow).
     
@@ -329,36 +715,43 @@ def fmp_get_financials(symbol: str, period: str = "annual", limit: int = 5) -> s
         symbol: Stock ticker symbol
         period: 'annual' or 'quarter'
         limit: Number of periods to retrieve
+        force_refresh: Bypass the 90-day response cache
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
-    symbol_clean = symbol.upper().strip()
+    symbol_clean = _sym(symbol)
     
     # Get all three financial statements
-    statements: Dict[str, Any] = {}
     endpoints = {
         "income_statement": f"{FMP_BASE_URL}/stable/income-statement",
         "balance_sheet": f"{FMP_BASE_URL}/stable/balance-sheet-statement",
         "cash_flow": f"{FMP_BASE_URL}/stable/cash-flow-statement"
     }
     
+    params = _fmp_params(symbol, period=period, limit=limit)
+    # Keep the statement order stable whatever order the responses arrive in
+    statements: Dict[str, Any] = dict.fromkeys(endpoints)
+
     try:
-        for stmt_name, url in endpoints.items():
-            params = {"symbol": symbol_clean, "period": period, "limit": limit, "apikey": api_key}
-            r = requests.get(url, params=params, timeout=20)
-            r.raise_for_status()
-            data = r.json()
-            statements[stmt_name] = data if isinstance(data, list) else []
+        # The three statements are independent, so fetch them concurrently over the pooled session
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as ex:
+            futures = {
+                ex.submit(_conditional_get, url, params, 20): stmt_name
+                for stmt_name, url in endpoints.items()
+            }
+            for fut in as_completed(futures):
+                data = _loads(fut.result())
+                statements[futures[fut]] = data if isinstance(data, list) else []
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol_clean,
             "period": period,
             "statements": statements
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
 def fmp_get_key_metrics(symbol: str, period: str = "annual", limit: int = 5) -> str:
@@ -369,62 +762,61 @@ def fmp_get_key_metrics(symbol: str, period: str = "annual", limit: int = 5) ->
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/key-metrics"
-    params = {
-        "symbol": symbol.upper().strip(),
-        "period": period,
-        "limit": limit,
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol, period=period, limit=limit)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
         
         metrics = data if isinstance(data, list) else []
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "period": period,
             "metrics": metrics
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
-def fmp_get_ratios(symbol: str, period: str = "annual", limit: int = 5) -> str:
+@_cached(ttl=TTL_WEEKLY)
+def fmp_get_ratios(symbol: str, period: str = "annual", limit: int = 5, force_refresh: bool = False) -> str:
     """
     Get financial ratios including liquidity, profitability, and efficiency ratios.
+    Cached for 7 days; pass force_refresh=True to bypass the cache.
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/ratios"
-    params = {
-        "symbol": symbol.upper().strip(),
-        "period": period,
-        "limit": limit,
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol, period=period, limit=limit)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "period": period,
             "ratios": data if isinstance(data, list) else []
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
-def fmp_get_historical_prices(symbol: str, from_date: Optional[str] = None, to_date: Optional[str] = None) -> str:
+@_cached(ttl=TTL_DAILY)
+def fmp_get_historical_prices(
+    symbol: str,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    force_refresh: bool = False,
+    guid: Optional[str] = None,
+) -> str:
     """
     Get historical stock prices.
     
@@ -432,17 +824,20 @@ def fmp_get_historical_prices(symbol: str, from_date: Optional[str] = None, to_d
         symbol: Stock ticker
         from_date: Start date (YYYY-MM-DD), defaults to 1 year ago
         to_date: End date (YYYY-MM-DD), defaults to today
+        force_refresh: Bypass the 1-day response cache
+        guid: If given, the bars are stored as the guid's "prices" data and only
+              a summary with the storage path is returned
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
-    if not from_date:
-        from_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-    if not to_date:
-        to_date = datetime.now().strftime("%Y-%m-%d")
+    if not from_date or not to_date:
+        today, year_ago = _utc_dates()
+        from_date = from_date or year_ago
+        to_date = to_date or today
 
-    url = f"{FMP_BASE_URL}/stable/historical-price-full/{symbol.upper().strip()}"
+    url = f"{FMP_BASE_URL}/stable/historical-price-full/{_sym(symbol)}"
     params = {
         "from": from_date,
         "to": to_date,
@@ -450,21 +845,26 @@ def fmp_get_historical_prices(symbol: str, from_date: Optional[str] = None, to_d
     }
 
     try:
-        r = requests.get(url, params=params, timeout=30)
+        r = _HTTP.get(url, params=params, timeout=30)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
         
         historical = data.get("historical", []) if isinstance(data, dict) else []
-        
-        return json.dumps({
+        out: Dict[str, Any] = {
             "symbol": symbol,
             "from": from_date,
             "to": to_date,
             "data_points": len(historical),
-            "historical": historical
-        }, ensure_ascii=False)
+        }
+
+        if guid:
+            # Persist server-side instead of echoing every bar back through the MCP transport
+            out["storage_path"] = str(_write_financial_data(guid, "prices", historical))
+        else:
+            out["historical"] = historical
+        return _dumps(out)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
 def fmp_get_analyst_estimates(symbol: str, period: str = "annual", limit: int = 4) -> str:
@@ -473,92 +873,88 @@ def fmp_get_analyst_estimates(symbol: str, period: str = "annual", limit: int =
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/analyst-estimates"
-    params = {
-        "symbol": symbol.upper().strip(),
-        "period": period,
-        "limit": limit,
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol, period=period, limit=limit)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "period": period,
             "estimates": data if isinstance(data, list) else []
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
-def fmp_get_insider_trading(symbol: str, limit: int = 50) -> str:
+@_cached(ttl=TTL_DAILY)
+def fmp_get_insider_trading(symbol: str, limit: int = 50, force_refresh: bool = False) -> str:
     """
     Get insider trading activity for a stock.
+    Cached for 1 day; pass force_refresh=True to bypass the cache.
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/insider-trading"
-    params = {
-        "symbol": symbol.upper().strip(),
-        "limit": limit,
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol, limit=limit)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
         
         trades = data if isinstance(data, list) else []
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "trade_count": len(trades),
             "trades": trades
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
-def fmp_get_institutional_holders(symbol: str) -> str:
+@_cached(ttl=TTL_WEEKLY)
+def fmp_get_institutional_holders(symbol: str, force_refresh: bool = False) -> str:
     """
     Get institutional holders and their positions.
+    Cached for 7 days; pass force_refresh=True to bypass the cache.
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/institutional-holder"
-    params = {
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
+        data = _loads(_conditional_get(url, params, timeout=20))
         
         holders = data if isinstance(data, list) else []
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "holder_count": len(holders),
             "holders": holders
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
-def fmp_get_sec_filings(symbol: str, filing_type: Optional[str] = None, limit: int = 20) -> str:
+@_cached(ttl=TTL_QUARTERLY)
+def fmp_get_sec_filings(
+    symbol: str,
+    filing_type: Optional[str] = None,
+    limit: int = 20,
+    force_refresh: bool = False,
+) -> str:
     """
     Get SEC filings (10-K, 10-Q, 8-K, etc.) for a company.
     
@@ -566,36 +962,31 @@ def fmp_get_sec_filings(symbol: str, filing_type: Optional[str] = None, limit: i
         symbol: Stock ticker
         filing_type: Filter by type (10-K, 10-Q, 8-K, etc.), None for all
         limit: Number of filings to retrieve
+        force_refresh: Bypass the 90-day response cache
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/sec_filings"
-    params: Dict[str, Any] = {
-        "symbol": symbol.upper().strip(),
-        "limit": limit,
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol, limit=limit)
     
     if filing_type:
         params["type"] = filing_type.upper()
 
     try:
-        r = requests.get(url, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
+        data = _loads(_conditional_get(url, params, timeout=20))
         
         filings = data if isinstance(data, list) else []
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "filing_type": filing_type,
             "filing_count": len(filings),
             "filings": filings
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
 def fmp_get_earnings_calendar(symbol: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None) -> str:
@@ -604,34 +995,34 @@ def fmp_get_earnings_calendar(symbol: Optional[str] = None, from_date: Optional[
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/earning_calendar"
     params: Dict[str, Any] = {"apikey": api_key}
     
     if symbol:
-        params["symbol"] = symbol.upper().strip()
+        params["symbol"] = _sym(symbol)
     if from_date:
         params["from"] = from_date
     if to_date:
         params["to"] = to_date
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
         
         calendar = data if isinstance(data, list) else []
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "from": from_date,
             "to": to_date,
             "event_count": len(calendar),
             "events": calendar
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
 def fmp_get_market_cap_history(symbol: str, limit: int = 100) -> str:
@@ -640,29 +1031,25 @@ def fmp_get_market_cap_history(symbol: str, limit: int = 100) -> str:
     """
     api_key = _fmp_key()
     if not api_key:
-        return json.dumps({"error": "FMP_API_KEY not set"})
+        return _dumps({"error": "FMP_API_KEY not set"})
 
     url = f"{FMP_BASE_URL}/stable/historical-market-capitalization"
-    params = {
-        "symbol": symbol.upper().strip(),
-        "limit": limit,
-        "apikey": api_key
-    }
+    params = _fmp_params(symbol, limit=limit)
 
     try:
-        r = requests.get(url, params=params, timeout=20)
+        r = _HTTP.get(url, params=params, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
         
         history = data if isinstance(data, list) else []
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "data_points": len(history),
             "history": history
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 # ----------------------------
 # Generic Web Scraping Tools
@@ -679,43 +1066,65 @@ def web_fetch_json(url: str, headers: Optional[str] = None, params: Optional[str
         params: JSON string of query parameters (optional)
     """
     try:
-        req_headers: Dict[str, Any] = json.loads(headers) if headers else {}
-        req_params: Dict[str, Any] = json.loads(params) if params else {}
+        req_headers: Dict[str, Any] = _loads(headers) if headers else {}
+        req_params: Dict[str, Any] = _loads(params) if params else {}
         
-        r = requests.get(url, headers=req_headers, params=req_params, timeout=30)
+        r = _HTTP.get(url, headers=req_headers, params=req_params, timeout=30)
         r.raise_for_status()
         
-        data = r.json()
+        data = _loads(r.content)
         
-        return json.dumps({
+        return _dumps({
             "url": url,
             "status_code": r.status_code,
             "data": data
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"url": url, "error": str(e)}, ensure_ascii=False)
+        return _dumps({"url": url, "error": str(e)})
+
+# web_fetch_html returns at most this many characters of the page
+HTML_CHAR_LIMIT = 10000
+# UTF-8 needs at most 4 bytes per character, so this many bytes always covers the limit
+_HTML_BYTE_BUDGET = 4 * HTML_CHAR_LIMIT
 
 @mcp.tool()
 def web_fetch_html(url: str) -> str:
     """
     Fetch HTML content from a webpage for scraping.
-    Returns the raw HTML text.
+    Returns the first 10k characters of the raw HTML text.
     """
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        r = requests.get(url, headers=headers, timeout=30)
-        r.raise_for_status()
-        
-        return json.dumps({
+        # Stream the body and stop once the budget is read, instead of downloading the whole page
+        with _HTTP.get(url, headers=headers, timeout=30, stream=True) as r:
+            r.raise_for_status()
+            buf = bytearray()
+            truncated = False
+            for chunk in r.iter_content(chunk_size=4096):
+                buf += chunk
+                if len(buf) >= _HTML_BYTE_BUDGET:
+                    truncated = True
+                    break
+            text = buf.decode(r.encoding or "utf-8", errors="replace")
+            header_length = r.headers.get("Content-Length", "")
+
+        # Upstream size when the server reports it, else the size of a fully read body
+        if header_length.isdigit():
+            content_length: Optional[int] = int(header_length)
+        else:
+            content_length = None if truncated else len(buf)
+
+        return _dumps({
             "url": url,
             "status_code": r.status_code,
-            "content_length": len(r.text),
-            "html": r.text[:10000]  # First 10k chars to avoid huge payloads
-        }, ensure_ascii=False)
+            "content_length": content_length,
+            "truncated": truncated or len(text) > HTML_CHAR_LIMIT,
+            "html": text[:HTML_CHAR_LIMIT]
+        })
     except Exception as e:
-        return json.dumps({"url": url, "error": str(e)}, ensure_ascii=False)
+        return _dumps({"url": url, "error": str(e)})
 
 # ----------------------------
 # Data Storage Tools
@@ -726,18 +1135,26 @@ def articles_save(guid: str, articles_json: str) -> str:
     """Save articles data for a given GUID."""
     p = _articles_path(guid)
     try:
-        data = _extract_json_any(articles_json)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        return json.dumps({"path": str(p)}, ensure_ascii=False)
+        raw = articles_json.encode("utf-8")
+        try:
+            data = _loads(raw)
+        except ValueError:
+            data = None
+        if isinstance(data, (dict, list)):
+            # Clean JSON is only checked and then stored as sent, with no re-serialization
+            p.write_bytes(raw)
+        else:
+            p.write_bytes(orjson.dumps(_extract_json_any(articles_json), option=orjson.OPT_INDENT_2))
+        return _dumps({"path": str(p)})
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
 def articles_load(guid: str) -> str:
     """Load stored articles for a given GUID."""
     p = _articles_path(guid)
     if not p.exists():
-        return json.dumps({"articles": [], "error": "No stored articles"}, ensure_ascii=False)
+        return _dumps({"articles": [], "error": "No stored articles"})
     return p.read_text(encoding="utf-8")
 
 @mcp.tool()
@@ -750,24 +1167,65 @@ def financial_data_save(guid: str, data_type: str, data_json: str) -> str:
         data_type: Type of data (financials, ratios, prices, etc.)
         data_json: JSON data to save
     """
-    p = _financial_data_path(guid, data_type)
     try:
-        data = _extract_json_any(data_json)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        return json.dumps({"path": str(p), "data_type": data_type}, ensure_ascii=False)
+        p = _write_financial_data(guid, data_type, _extract_json_any(data_json))
+        return _dumps({"path": str(p), "data_type": data_type})
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)})
+
+@mcp.tool()
+def financial_data_save_many(guid: str, data_json: str) -> str:
+    """
+    Save several financial data types for a GUID in one call.
+    
+    Args:
+        guid: Unique identifier
+        data_json: JSON object mapping data_type -> data
+    """
+    try:
+        batch = _extract_json_obj(data_json)
+    except Exception as e:
+        return _dumps({"error": str(e)})
+
+    try:
+        p = _append_financial_data(guid, batch)
+        return _dumps({"guid": guid, "path": str(p), "data_types": list(batch)})
+    except Exception as e:
+        return _dumps({"error": str(e)})
 
 @mcp.tool()
 def financial_data_load(guid: str, data_type: str) -> str:
     """
     Load financial data of a specific type for a GUID.
     """
+    raw = _read_financial_data_raw(guid, data_type)
+    if raw is not None:
+        return raw.decode("utf-8")
     p = _financial_data_path(guid, data_type)
     if not p.exists():
-        return json.dumps({"error": f"No {data_type} data found for guid={guid}"}, ensure_ascii=False)
+        return _dumps({"error": f"No {data_type} data found for guid={guid}"})
     return p.read_text(encoding="utf-8")
 
+@mcp.tool()
+def financial_data_load_all(guid: str) -> str:
+    """
+    Load the latest record of every financial data type for a GUID in one call.
+    """
+    latest: Dict[str, bytes] = {}
+    try:
+        for data_type, path in _iter_legacy_financial_files(guid):
+            with open(path, "rb") as f:
+                latest[data_type] = f.read()
+        for data_type, raw in _iter_financial_data(guid):
+            latest[data_type] = raw
+    except Exception as e:
+        return _dumps({"error": str(e)})
+    if not latest:
+        return _dumps({"error": f"No financial data found for guid={guid}"})
+    # Records are already serialized, so splice them into the response as-is
+    body = b",".join(orjson.dumps(k) + b":" + v for k, v in latest.items())
+    return (b'{"guid":' + orjson.dumps(guid) + b',"data":{' + body + b"}}").decode("utf-8")
+
 @mcp.tool()
 def list_saved_data(guid: str) -> str:
     """
@@ -777,38 +1235,268 @@ def list_saved_data(guid: str) -> str:
         files = []
         
         # Check finance state
-        state_file = STATE_DIR / f"{guid}.json"
-        if state_file.exists():
-            files.append({"type": "finance_state", "path": str(state_file)})
+        state_file = str(_state_path(guid))
+        if os.path.exists(state_file):
+            files.append({"type": "finance_state", "path": state_file})
         
         # Check articles
-        articles_file = _articles_path(guid)
-        if articles_file.exists():
-            files.append({"type": "articles", "path": str(articles_file)})
+        articles_file = str(_articles_path(guid))
+        if os.path.exists(articles_file):
+            files.append({"type": "articles", "path": articles_file})
         
-        # Check financial data
-        for file in FINANCIAL_DATA_DIR.glob(f"{guid}_*.json"):
-            data_type = file.stem.replace(f"{guid}_", "")
-            files.append({"type": data_type, "path": str(file)})
+        # Check financial data (legacy per-type files, then the NDJSON log)
+        seen = set()
+        for data_type, path in _iter_legacy_financial_files(guid):
+            seen.add(data_type)
+            files.append({"type": data_type, "path": path})
+        log = _financial_data_log(guid)
+        for data_type, _ in _iter_financial_data(guid):
+            if data_type not in seen:
+                seen.add(data_type)
+                files.append({"type": data_type, "path": str(log)})
         
-        return json.dumps({
+        return _dumps({
             "guid": guid,
             "file_count": len(files),
             "files": files
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)})
 
 # ----------------------------
 # Alpha Vantage MCP Tools (Fallback/Supplementary Data Source)
 # ----------------------------
 
+# Agents often repeat an AV call for the same symbol within a turn; identical calls in
+# the next 60 s reuse the raw body, which also spares the 25 requests/day free quota
+_AV_CACHE: TTLCache = TTLCache(maxsize=512, ttl=60)
+# Bodies that came with an ETag/Last-Modified outlive the TTL: once it lapses they are
+# revalidated, and a 304 reuses them. Keyed like _AV_CACHE and guarded by the same lock.
+_AV_VALIDATED: LRUCache = LRUCache(maxsize=64)
+_AV_CACHE_LOCK = threading.Lock()
+# AV reports rate limits and bad requests with HTTP 200 and one of these keys
+_AV_SOFT_ERRORS = (b'"Note"', b'"Information"', b'"Error Message"')
+
+async def _av_warm_up() -> None:
+    """
+    Open a pooled connection to alphavantage.co so the first AV tool call skips the
+    TCP/TLS handshake. A HEAD on the site root spends none of the API quota.
+    """
+    if not _alpha_vantage_key():
+        return
+    try:
+        await _AV_ACLIENT.head("https://www.alphavantage.co/", timeout=5)
+    except httpx.HTTPError:
+        pass
+
+# Rate-limit and transient 5xx responses are retried after these delays (seconds)
+_AV_RETRY_DELAYS = (0.2, 0.4)
+
+async def _av_call(function: str, timeout: int = 20, **params: Any) -> bytes:
+    """
+    GET an Alpha Vantage function and return the raw response body.
+
+    Repeats within the TTL are served from memory. After that, a body stored with
+    validators is revalidated, so a 304 costs only the round trip. The free tier sends
+    no validators, which makes the TTL the only policy there.
+    """
+    key = (function, tuple(sorted(params.items())))
+    with _AV_CACHE_LOCK:
+        content = _AV_CACHE.get(key)
+        validated = _AV_VALIDATED.get(key)
+    if content is not None:
+        return content
+
+    headers: Dict[str, str] = {}
+    if validated is not None:
+        etag, last_modified, _ = validated
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    query = {"function": function, **params, "apikey": _alpha_vantage_key()}
+    for delay in (*_AV_RETRY_DELAYS, None):
+        r = await _AV_ACLIENT.get(ALPHA_VANTAGE_BASE_URL, params=query, headers=headers, timeout=timeout)
+        if delay is None or r.status_code not in _RETRY_STATUSES:
+            break
+        await asyncio.sleep(delay)
+
+    if r.status_code == 304 and validated is not None:
+        content = validated[2]
+        with _AV_CACHE_LOCK:
+            _AV_CACHE[key] = content
+        return content
+
+    r.raise_for_status()
+    content = r.content
+    head = content[:128]
+    if not any(marker in head for marker in _AV_SOFT_ERRORS):
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        with _AV_CACHE_LOCK:
+            _AV_CACHE[key] = content
+            if etag or last_modified:
+                _AV_VALIDATED[key] = (etag, last_modified, content)
+    return content
+
+# simdjson parsers are reusable but not thread-safe, and the event loop and worker
+# threads (fmp_batch) may both parse, so each thread keeps its own.
+_SIMDJSON_LOCAL = threading.local()
+
+def _simdjson_to_python(value: Any) -> Any:
+    # The parser reuses its buffer on the next parse, so proxies must not escape
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+def _av_members(content: bytes, limits: Dict[str, Optional[int]]) -> Dict[str, Any]:
+    """
+    Return the named top-level members of an Alpha Vantage JSON body.
+
+    limits maps each member to how many leading list elements to keep (None keeps it
+    whole). With pysimdjson only the kept elements become Python objects; otherwise
+    orjson parses the body and the lists are sliced.
+    """
+    out: Dict[str, Any] = {}
+    if simdjson is None:
+        data = _loads(content)
+        if not isinstance(data, dict):
+            return out
+        for key, n in limits.items():
+            if key in data:
+                value = data[key]
+                out[key] = value[:n] if n is not None and isinstance(value, list) else value
+        return out
+
+    parser = getattr(_SIMDJSON_LOCAL, "parser", None)
+    if parser is None:
+        parser = _SIMDJSON_LOCAL.parser = simdjson.Parser()
+    doc = parser.parse(content)
+    if not isinstance(doc, simdjson.Object):
+        return out
+    for key, n in limits.items():
+        if key not in doc:
+            continue
+        value = doc[key]
+        if n is not None and isinstance(value, simdjson.Array):
+            out[key] = [_simdjson_to_python(value[i]) for i in range(min(n, len(value)))]
+        else:
+            out[key] = _simdjson_to_python(value)
+    return out
+
+# Alpha Vantage sends numbers as strings and uses "None"/"-" placeholders for missing ones
+if try_float is not None:
+    def _av_float(data: Dict[str, Any], key: str, default: Optional[float] = None) -> Optional[float]:
+        return try_float(data.get(key, default), on_fail=default, on_type_error=default)
+else:
+    def _av_float(data: Dict[str, Any], key: str, default: Optional[float] = None) -> Optional[float]:
+        try:
+            return float(data[key])
+        except (KeyError, TypeError, ValueError):
+            return default
+
+# Alpha Vantage daily-series field -> output column, in output order
+_AV_DAILY_COLUMNS = {
+    "1. open": "open",
+    "2. high": "high",
+    "3. low": "low",
+    "4. close": "close",
+    "5. adjusted close": "adjusted_close",
+    "6. volume": "volume",
+    "7. dividend amount": "dividend_amount",
+    "8. split coefficient": "split_coefficient",
+}
+
+@functools.lru_cache(maxsize=1)
+def _pandas():
+    """pandas is optional and slow to import, so it is only loaded on first use."""
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
+
+# Float columns of the columnar daily output; volume goes in its own integer column
+_AV_DAILY_VALUE_COLUMNS = [c for c in _AV_DAILY_COLUMNS.values() if c != "volume"]
+
+def _av_ascending(time_series: Dict[str, Dict[str, str]]) -> bool:
+    # AV sends the series newest-first and both JSON parsers keep key order, so the
+    # dates never need sorting; comparing the two ends still catches an ascending body
+    return len(time_series) > 1 and next(iter(time_series)) < next(reversed(time_series))
+
+def _av_daily_frame(pd: Any, time_series: Dict[str, Dict[str, str]]) -> Any:
+    """Newest-first DataFrame of an AV daily series, indexed by date string."""
+    # One astype per column instead of eight float()/int() calls per row
+    df = (
+        pd.DataFrame.from_dict(time_series, orient="index")
+        .reindex(columns=list(_AV_DAILY_COLUMNS))
+        .rename(columns=_AV_DAILY_COLUMNS)
+        .fillna({"split_coefficient": 1.0})
+        .fillna(0)
+    )
+    df = df.astype({c: "int64" if c == "volume" else "float64" for c in _AV_DAILY_COLUMNS.values()})
+    if _av_ascending(time_series):
+        df = df.iloc[::-1]
+    df.index.name = "date"
+    return df
+
+def _av_daily_rows(time_series: Dict[str, Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Newest-first rows of an AV daily series, converted column-wise when pandas is installed."""
+    pd = _pandas()
+    if pd is None:
+        ascending = _av_ascending(time_series)
+        return [
+            {
+                "date": date,
+                "open": float(values.get("1. open", 0)),
+                "high": float(values.get("2. high", 0)),
+                "low": float(values.get("3. low", 0)),
+                "close": float(values.get("4. close", 0)),
+                "adjusted_close": float(values.get("5. adjusted close", 0)),
+                "volume": int(values.get("6. volume", 0)),
+                "dividend_amount": float(values.get("7. dividend amount", 0)),
+                "split_coefficient": float(values.get("8. split coefficient", 1.0)),
+            }
+            for date, values in (reversed(time_series.items()) if ascending else time_series.items())
+        ]
+    return _av_daily_frame(pd, time_series).reset_index().to_dict("records")
+
+def _av_daily_columns(time_series: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Newest-first AV daily series as parallel columns: dates, a date x column value
+    matrix and volume. With pandas the matrix and volume stay NumPy arrays, so no
+    Python float is built per cell on the way to JSON.
+    """
+    pd = _pandas()
+    if pd is None:
+        rows = _av_daily_rows(time_series)
+        return {
+            "dates": [row["date"] for row in rows],
+            "columns": _AV_DAILY_VALUE_COLUMNS,
+            "values": [[row[c] for c in _AV_DAILY_VALUE_COLUMNS] for row in rows],
+            "volume": [row["volume"] for row in rows],
+        }
+
+    import numpy as np  # a pandas dependency
+
+    df = _av_daily_frame(pd, time_series)
+    return {
+        "dates": df.index.tolist(),
+        "columns": _AV_DAILY_VALUE_COLUMNS,
+        # orjson only serializes C-contiguous arrays
+        "values": np.ascontiguousarray(df[_AV_DAILY_VALUE_COLUMNS].to_numpy(dtype=np.float64)),
+        "volume": np.ascontiguousarray(df["volume"].to_numpy(dtype=np.int64)),
+    }
+
 @mcp.tool()
-def av_healthcheck() -> str:
+async def av_healthcheck() -> str:
     """Check if Alpha Vantage API is accessible."""
     api_key = _alpha_vantage_key()
     if not api_key:
-        return json.dumps({"ok": False, "error": "ALPHA_VANTAGE_API_KEY not set in environment"}, ensure_ascii=False)
+        return _dumps({"ok": False, "error": "ALPHA_VANTAGE_API_KEY not set in environment"})
 
     params = {
         "function": "GLOBAL_QUOTE",
@@ -817,367 +1505,317 @@ def av_healthcheck() -> str:
     }
     
     try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        return json.dumps(
-            {"ok": r.status_code == 200, "status_code": r.status_code},
-            ensure_ascii=False
+        r = await _AV_ACLIENT.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
+        return _dumps(
+            {"ok": r.status_code == 200, "status_code": r.status_code}
         )
     except Exception as e:
-        return json.dumps({"ok": False, "error": str(e)}, ensure_ascii=False)
+        return _dumps({"ok": False, "error": str(e)})
 
-@mcp.tool()
-def av_get_quote(symbol: str) -> str:
-    """
-    Get real-time quote from Alpha Vantage.
-    Alternative/fallback to FMP quote data.
-    """
+async def _av_quote(symbol: str) -> Dict[str, Any]:
+    """av_get_quote's result as a dict, for hybrid_get_quote."""
     api_key = _alpha_vantage_key()
     if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
-
-    params = {
-        "function": "GLOBAL_QUOTE",
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
+        return {"error": "ALPHA_VANTAGE_API_KEY not set"}
 
     try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
+        data = _loads(await _av_call("GLOBAL_QUOTE", symbol=_sym(symbol)))
         
         quote = data.get("Global Quote", {})
         
         if not quote:
-            return json.dumps({"symbol": symbol, "error": "No data returned from Alpha Vantage"})
+            return {"symbol": symbol, "error": "No data returned from Alpha Vantage"}
         
-        return json.dumps({
+        return {
             "symbol": quote.get("01. symbol"),
-            "price": float(quote.get("05. price", 0)),
-            "change": float(quote.get("09. change", 0)),
+            "price": _av_float(quote, "05. price", 0.0),
+            "change": _av_float(quote, "09. change", 0.0),
             "changePercent": quote.get("10. change percent", "0%").replace("%", ""),
             "volume": int(quote.get("06. volume", 0)),
             "latestTradingDay": quote.get("07. latest trading day"),
-            "previousClose": float(quote.get("08. previous close", 0)),
-            "open": float(quote.get("02. open", 0)),
-            "high": float(quote.get("03. high", 0)),
-            "low": float(quote.get("04. low", 0)),
+            "previousClose": _av_float(quote, "08. previous close", 0.0),
+            "open": _av_float(quote, "02. open", 0.0),
+            "high": _av_float(quote, "03. high", 0.0),
+            "low": _av_float(quote, "04. low", 0.0),
             "source": "Alpha Vantage"
-        }, ensure_ascii=False)
+        }
     except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)})
+        return {"symbol": symbol, "error": str(e)}
 
 @mcp.tool()
-def av_get_company_overview(symbol: str) -> str:
+async def av_get_quote(symbol: str) -> str:
     """
-    Get company overview and fundamental data from Alpha Vantage.
-    Alternative/fallback to FMP profile data.
+    Get real-time quote from Alpha Vantage.
+    Alternative/fallback to FMP quote data.
     """
+    return _dumps(await _av_quote(symbol))
+
+# (output field, OVERVIEW key, getter) in output order; numeric fields go through _av_float
+_AV_OVERVIEW_FIELDS = (
+    ("symbol", "Symbol", dict.get),
+    ("name", "Name", dict.get),
+    ("description", "Description", dict.get),
+    ("sector", "Sector", dict.get),
+    ("industry", "Industry", dict.get),
+    ("exchange", "Exchange", dict.get),
+    ("currency", "Currency", dict.get),
+    ("country", "Country", dict.get),
+    ("marketCap", "MarketCapitalization", _av_float),
+    ("peRatio", "PERatio", _av_float),
+    ("eps", "EPS", _av_float),
+    ("dividendYield", "DividendYield", _av_float),
+    ("beta", "Beta", _av_float),
+    ("week52High", "52WeekHigh", _av_float),
+    ("week52Low", "52WeekLow", _av_float),
+    ("day50MovingAverage", "50DayMovingAverage", _av_float),
+    ("day200MovingAverage", "200DayMovingAverage", _av_float),
+    ("analystTargetPrice", "AnalystTargetPrice", _av_float),
+    ("profitMargin", "ProfitMargin", _av_float),
+    ("operatingMargin", "OperatingMarginTTM", _av_float),
+    ("returnOnAssets", "ReturnOnAssetsTTM", _av_float),
+    ("returnOnEquity", "ReturnOnEquityTTM", _av_float),
+    ("revenuePerShare", "RevenuePerShareTTM", _av_float),
+    ("quarterlyEarningsGrowth", "QuarterlyEarningsGrowthYOY", _av_float),
+    ("quarterlyRevenueGrowth", "QuarterlyRevenueGrowthYOY", _av_float),
+    ("bookValue", "BookValue", _av_float),
+    ("priceToBook", "PriceToBookRatio", _av_float),
+    ("evToRevenue", "EVToRevenue", _av_float),
+    ("evToEbitda", "EVToEBITDA", _av_float),
+)
+
+async def _av_overview(symbol: str) -> Dict[str, Any]:
+    """av_get_company_overview's result as a dict, for hybrid_get_company_info."""
     api_key = _alpha_vantage_key()
     if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
-
-    params = {
-        "function": "OVERVIEW",
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
+        return {"error": "ALPHA_VANTAGE_API_KEY not set"}
 
     try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
+        data = _loads(await _av_call("OVERVIEW", symbol=_sym(symbol)))
         
         if not data or "Symbol" not in data:
-            return json.dumps({"symbol": symbol, "error": "No overview data available"})
+            return {"symbol": symbol, "error": "No overview data available"}
         
-        return json.dumps({
-            "symbol": data.get("Symbol"),
-            "name": data.get("Name"),
-            "description": data.get("Description"),
-            "sector": data.get("Sector"),
-            "industry": data.get("Industry"),
-            "exchange": data.get("Exchange"),
-            "currency": data.get("Currency"),
-            "country": data.get("Country"),
-            "marketCap": float(data.get("MarketCapitalization", 0)) if data.get("MarketCapitalization") else None,
-            "peRatio": float(data.get("PERatio", 0)) if data.get("PERatio") else None,
-            "eps": float(data.get("EPS", 0)) if data.get("EPS") else None,
-            "dividendYield": float(data.get("DividendYield", 0)) if data.get("DividendYield") else None,
-            "beta": float(data.get("Beta", 0)) if data.get("Beta") else None,
-            "week52High": float(data.get("52WeekHigh", 0)) if data.get("52WeekHigh") else None,
-            "week52Low": float(data.get("52WeekLow", 0)) if data.get("52WeekLow") else None,
-            "day50MovingAverage": float(data.get("50DayMovingAverage", 0)) if data.get("50DayMovingAverage") else None,
-            "day200MovingAverage": float(data.get("200DayMovingAverage", 0)) if data.get("200DayMovingAverage") else None,
-            "analystTargetPrice": float(data.get("AnalystTargetPrice", 0)) if data.get("AnalystTargetPrice") else None,
-            "profitMargin": float(data.get("ProfitMargin", 0)) if data.get("ProfitMargin") else None,
-            "operatingMargin": float(data.get("OperatingMarginTTM", 0)) if data.get("OperatingMarginTTM") else None,
-            "returnOnAssets": float(data.get("ReturnOnAssetsTTM", 0)) if data.get("ReturnOnAssetsTTM") else None,
-            "returnOnEquity": float(data.get("ReturnOnEquityTTM", 0)) if data.get("ReturnOnEquityTTM") else None,
-            "revenuePerShare": float(data.get("RevenuePerShareTTM", 0)) if data.get("RevenuePerShareTTM") else None,
-            "quarterlyEarningsGrowth": float(data.get("QuarterlyEarningsGrowthYOY", 0)) if data.get("QuarterlyEarningsGrowthYOY") else None,
-            "quarterlyRevenueGrowth": float(data.get("QuarterlyRevenueGrowthYOY", 0)) if data.get("QuarterlyRevenueGrowthYOY") else None,
-            "bookValue": float(data.get("BookValue", 0)) if data.get("BookValue") else None,
-            "priceToBook": float(data.get("PriceToBookRatio", 0)) if data.get("PriceToBookRatio") else None,
-            "evToRevenue": float(data.get("EVToRevenue", 0)) if data.get("EVToRevenue") else None,
-            "evToEbitda": float(data.get("EVToEBITDA", 0)) if data.get("EVToEBITDA") else None,
-            "source": "Alpha Vantage"
-        }, ensure_ascii=False)
+        overview = {out: get(data, key) for out, key, get in _AV_OVERVIEW_FIELDS}
+        overview["source"] = "Alpha Vantage"
+        return overview
     except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)})
+        return {"symbol": symbol, "error": str(e)}
 
 @mcp.tool()
-def av_get_income_statement(symbol: str) -> str:
+async def av_get_company_overview(symbol: str) -> str:
     """
-    Get annual income statements from Alpha Vantage.
-    Alternative/fallback to FMP financial statements.
+    Get company overview and fundamental data from Alpha Vantage.
+    Alternative/fallback to FMP profile data.
     """
-    api_key = _alpha_vantage_key()
-    if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
+    return _dumps(await _av_overview(symbol))
+
+# Each report list: (Alpha Vantage key, output key, how many leading entries to keep)
+_AvReports = Tuple[str, str, Optional[int]]
+
+def _av_statement_tool(function: str, docstring: str, annual: _AvReports, quarterly: _AvReports):
+    """Build and register an av_* tool returning one AV statement function's report lists."""
+    limits = {"symbol": None, annual[0]: annual[2], quarterly[0]: quarterly[2]}
+
+    async def tool(symbol: str) -> str:
+        api_key = _alpha_vantage_key()
+        if not api_key:
+            return _dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
+
+        try:
+            # Only the reports that are returned get materialized
+            data = _av_members(await _av_call(function, symbol=_sym(symbol)), limits)
+            return _dumps({
+                "symbol": data.get("symbol", symbol),
+                annual[1]: data.get(annual[0], []),
+                quarterly[1]: data.get(quarterly[0], []),
+                "source": "Alpha Vantage"
+            })
+        except Exception as e:
+            return _dumps({"symbol": symbol, "error": str(e)})
 
-    params = {
-        "function": "INCOME_STATEMENT",
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
+    tool.__name__ = tool.__qualname__ = "av_get_" + function.lower()
+    tool.__doc__ = docstring
+    return mcp.tool()(tool)
 
-    try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-        
-        annual_reports = data.get("annualReports", [])
-        quarterly_reports = data.get("quarterlyReports", [])
-        
-        return json.dumps({
-            "symbol": data.get("symbol", symbol),
-            "annual_reports": annual_reports[:5],  # Last 5 years
-            "quarterly_reports": quarterly_reports[:4],  # Last 4 quarters
-            "source": "Alpha Vantage"
-        }, ensure_ascii=False)
-    except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)})
+av_get_income_statement = _av_statement_tool(
+    "INCOME_STATEMENT",
+    """
+    Get annual income statements from Alpha Vantage.
+    Alternative/fallback to FMP financial statements.
+    """,
+    ("annualReports", "annual_reports", 5),  # Last 5 years
+    ("quarterlyReports", "quarterly_reports", 4),  # Last 4 quarters
+)
 
-@mcp.tool()
-def av_get_balance_sheet(symbol: str) -> str:
+av_get_balance_sheet = _av_statement_tool(
+    "BALANCE_SHEET",
     """
     Get annual balance sheets from Alpha Vantage.
     Alternative/fallback to FMP financial statements.
-    """
-    api_key = _alpha_vantage_key()
-    if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
-
-    params = {
-        "function": "BALANCE_SHEET",
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
+    """,
+    ("annualReports", "annual_reports", 5),
+    ("quarterlyReports", "quarterly_reports", 4),
+)
 
-    try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-        
-        annual_reports = data.get("annualReports", [])
-        quarterly_reports = data.get("quarterlyReports", [])
-        
-        return json.dumps({
-            "symbol": data.get("symbol", symbol),
-            "annual_reports": annual_reports[:5],
-            "quarterly_reports": quarterly_reports[:4],
-            "source": "Alpha Vantage"
-        }, ensure_ascii=False)
-    except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)})
-
-@mcp.tool()
-def av_get_cash_flow(symbol: str) -> str:
+av_get_cash_flow = _av_statement_tool(
+    "CASH_FLOW",
     """
     Get annual cash flow statements from Alpha Vantage.
     Alternative/fallback to FMP financial statements.
-    """
-    api_key = _alpha_vantage_key()
-    if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
+    """,
+    ("annualReports", "annual_reports", 5),
+    ("quarterlyReports", "quarterly_reports", 4),
+)
 
-    params = {
-        "function": "CASH_FLOW",
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
-
-    try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-        
-        annual_reports = data.get("annualReports", [])
-        quarterly_reports = data.get("quarterlyReports", [])
-        
-        return json.dumps({
-            "symbol": data.get("symbol", symbol),
-            "annual_reports": annual_reports[:5],
-            "quarterly_reports": quarterly_reports[:4],
-            "source": "Alpha Vantage"
-        }, ensure_ascii=False)
-    except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)})
+av_get_earnings = _av_statement_tool(
+    "EARNINGS",
+    """
+    Get quarterly and annual earnings data from Alpha Vantage.
+    """,
+    ("annualEarnings", "annual_earnings", None),
+    ("quarterlyEarnings", "quarterly_earnings", 8),  # Last 8 quarters
+)
 
 @mcp.tool()
-def av_get_time_series_daily(symbol: str, outputsize: str = "compact") -> str:
+async def av_get_time_series_daily(symbol: str, outputsize: str = "compact", columnar: bool = False) -> str:
     """
     Get daily historical stock prices from Alpha Vantage.
     
     Args:
         symbol: Stock ticker
         outputsize: 'compact' (100 days) or 'full' (20+ years)
+        columnar: Return dates/values/volume columns instead of one object per day
+                  (much smaller and faster for 'full')
     """
     api_key = _alpha_vantage_key()
     if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
-
-    params = {
-        "function": "TIME_SERIES_DAILY_ADJUSTED",
-        "symbol": symbol.upper().strip(),
-        "outputsize": outputsize,
-        "apikey": api_key
-    }
+        return _dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
 
     try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=30)
-        r.raise_for_status()
-        data = r.json()
-        
-        time_series = data.get("Time Series (Daily)", {})
+        content = await _av_call("TIME_SERIES_DAILY_ADJUSTED", timeout=30, symbol=_sym(symbol), outputsize=outputsize)
+        # Only the series is needed; "Meta Data" and the rest are never materialized
+        time_series = _av_members(content, {"Time Series (Daily)": None}).get("Time Series (Daily)")
         
         if not time_series:
-            return json.dumps({"symbol": symbol, "error": "No time series data available"})
+            return _dumps({"symbol": symbol, "error": "No time series data available"})
         
-        # Convert to list format for easier processing
-        historical = []
-        for date, values in sorted(time_series.items(), reverse=True):
-            historical.append({
-                "date": date,
-                "open": float(values.get("1. open", 0)),
-                "high": float(values.get("2. high", 0)),
-                "low": float(values.get("3. low", 0)),
-                "close": float(values.get("4. close", 0)),
-                "adjusted_close": float(values.get("5. adjusted close", 0)),
-                "volume": int(values.get("6. volume", 0)),
-                "dividend_amount": float(values.get("7. dividend amount", 0)),
-                "split_coefficient": float(values.get("8. split coefficient", 1.0))
+        if columnar:
+            columns = _av_daily_columns(time_series)
+            return _dumps({
+                "symbol": symbol,
+                "data_points": len(columns["dates"]),
+                **columns,
+                "source": "Alpha Vantage"
             })
+
+        # Convert to list format for easier processing
+        historical = _av_daily_rows(time_series)
         
-        return json.dumps({
+        return _dumps({
             "symbol": symbol,
             "data_points": len(historical),
             "historical": historical,
             "source": "Alpha Vantage"
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)})
+        return _dumps({"symbol": symbol, "error": str(e)})
+
+# SYMBOL_SEARCH numbered keys and their output names (matchScore is coerced separately)
+_AV_SEARCH_KEYS = ("1. symbol", "2. name", "3. type", "4. region", "8. currency")
+_AV_SEARCH_FIELDS = ("symbol", "name", "type", "region", "currency")
+_AV_SEARCH_GET = operator.itemgetter(*_AV_SEARCH_KEYS)
 
 @mcp.tool()
-def av_search_symbol(keywords: str) -> str:
+async def av_search_symbol(keywords: str) -> str:
     """
     Search for stock symbols by company name using Alpha Vantage.
     Alternative/fallback to FMP symbol search.
     """
     api_key = _alpha_vantage_key()
     if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
-
-    params = {
-        "function": "SYMBOL_SEARCH",
-        "keywords": keywords,
-        "apikey": api_key
-    }
+        return _dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
 
     try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-        
-        matches = data.get("bestMatches", [])
+        data = _av_members(await _av_call("SYMBOL_SEARCH", keywords=keywords), {"bestMatches": 10})
         
         results = []
-        for match in matches[:10]:  # Top 10 results
-            results.append({
-                "symbol": match.get("1. symbol"),
-                "name": match.get("2. name"),
-                "type": match.get("3. type"),
-                "region": match.get("4. region"),
-                "currency": match.get("8. currency"),
-                "matchScore": float(match.get("9. matchScore", 0))
-            })
+        for match in data.get("bestMatches", []):  # Top 10 results
+            try:
+                # One C-level call fetches every numbered field of the match
+                values = _AV_SEARCH_GET(match)
+            except KeyError:
+                values = tuple(match.get(k) for k in _AV_SEARCH_KEYS)
+            row = dict(zip(_AV_SEARCH_FIELDS, values))
+            row["matchScore"] = _av_float(match, "9. matchScore", 0.0)
+            results.append(row)
         
-        return json.dumps({
+        return _dumps({
             "keywords": keywords,
             "results": results,
             "source": "Alpha Vantage"
-        }, ensure_ascii=False)
-    except Exception as e:
-        return json.dumps({"keywords": keywords, "error": str(e)})
-
-@mcp.tool()
-def av_get_earnings(symbol: str) -> str:
-    """
-    Get quarterly and annual earnings data from Alpha Vantage.
-    """
-    api_key = _alpha_vantage_key()
-    if not api_key:
-        return json.dumps({"error": "ALPHA_VANTAGE_API_KEY not set"})
-
-    params = {
-        "function": "EARNINGS",
-        "symbol": symbol.upper().strip(),
-        "apikey": api_key
-    }
-
-    try:
-        r = requests.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-        
-        return json.dumps({
-            "symbol": data.get("symbol", symbol),
-            "annual_earnings": data.get("annualEarnings", []),
-            "quarterly_earnings": data.get("quarterlyEarnings", [])[:8],  # Last 8 quarters
-            "source": "Alpha Vantage"
-        }, ensure_ascii=False)
+        })
     except Exception as e:
-        return json.dumps({"symbol": symbol, "error": str(e)})
+        return _dumps({"keywords": keywords, "error": str(e)})
 
 # ----------------------------
 # Hybrid Tools (Try FMP first, fallback to Alpha Vantage)
 # ----------------------------
 
+# How long the FMP call may run before the Alpha Vantage fallback is started alongside it.
+# Starting AV unconditionally would spend its 25 requests/day on calls FMP answers.
+HYBRID_HEDGE_DELAY = 0.75
+
+async def _hedged_fallback(
+    primary: Callable[[str], str],
+    fallback: Callable[[str], Awaitable[Dict[str, Any]]],
+    symbol: str,
+    accept: Callable[[Dict[str, Any]], bool],
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Run the sync primary(symbol) in a thread, starting the async fallback(symbol) as soon
+    as the primary fails or has not answered within HYBRID_HEDGE_DELAY. Returns
+    (primary_data, fallback_data), where fallback_data is None if the primary was
+    accepted. Worst case is max, not sum, of both.
+
+    The primary is a disk-cached FMP tool, so its JSON is parsed once; the fallback
+    already returns a dict.
+    """
+    t_primary = asyncio.ensure_future(asyncio.to_thread(primary, symbol))
+    try:
+        primary_data = _loads(await asyncio.wait_for(asyncio.shield(t_primary), HYBRID_HEDGE_DELAY))
+    except asyncio.TimeoutError:
+        t_fallback = asyncio.ensure_future(fallback(symbol))
+        primary_data = _loads(await t_primary)
+        if accept(primary_data):
+            # The fallback is already in flight; its result is simply dropped
+            return primary_data, None
+    else:
+        if accept(primary_data):
+            return primary_data, None
+        t_fallback = asyncio.ensure_future(fallback(symbol))
+    return primary_data, await t_fallback
+
 @mcp.tool()
-def hybrid_get_quote(symbol: str) -> str:
+async def hybrid_get_quote(symbol: str) -> str:
     """
     Get stock quote with automatic fallback.
-    Tries FMP first, falls back to Alpha Vantage if FMP fails.
+    Tries FMP first, falls back to Alpha Vantage if FMP fails or is slow.
     """
-    # Try FMP first
-    fmp_result = fmp_quote(symbol)
-    fmp_data = json.loads(fmp_result)
+    fmp_data, av_data = await _hedged_fallback(
+        fmp_quote, _av_quote, symbol,
+        lambda d: "error" not in d and bool(d.get("price")),
+    )
     
-    if "error" not in fmp_data and fmp_data.get("price"):
+    if av_data is None:
         fmp_data["source"] = "FMP (primary)"
-        return json.dumps(fmp_data, ensure_ascii=False)
-    
-    # Fallback to Alpha Vantage
-    av_result = av_get_quote(symbol)
-    av_data = json.loads(av_result)
+        return _dumps(fmp_data)
     
     if "error" not in av_data:
         av_data["source"] = "Alpha Vantage (fallback)"
-        return json.dumps(av_data, ensure_ascii=False)
+        return _dumps(av_data)
     
     # Both failed
-    return json.dumps({
+    return _dumps({
         "symbol": symbol,
         "error": "Failed to get quote from both FMP and Alpha Vantage",
         "fmp_error": fmp_data.get("error"),
@@ -1185,34 +1823,183 @@ def hybrid_get_quote(symbol: str) -> str:
     })
 
 @mcp.tool()
-def hybrid_get_company_info(symbol: str) -> str:
+async def hybrid_get_company_info(symbol: str) -> str:
     """
     Get company information with automatic fallback.
-    Tries FMP first, falls back to Alpha Vantage if FMP fails.
+    Tries FMP first, falls back to Alpha Vantage if FMP fails or is slow.
     """
-    # Try FMP first
-    fmp_result = fmp_get_profile(symbol)
-    fmp_data = json.loads(fmp_result)
+    fmp_data, av_data = await _hedged_fallback(
+        fmp_get_profile, _av_overview, symbol,
+        lambda d: "error" not in d and bool(d.get("description")),
+    )
     
-    if "error" not in fmp_data and fmp_data.get("description"):
+    if av_data is None:
         fmp_data["source"] = "FMP (primary)"
-        return json.dumps(fmp_data, ensure_ascii=False)
-    
-    # Fallback to Alpha Vantage
-    av_result = av_get_company_overview(symbol)
-    av_data = json.loads(av_result)
+        return _dumps(fmp_data)
     
     if "error" not in av_data:
         av_data["source"] = "Alpha Vantage (fallback)"
-        return json.dumps(av_data, ensure_ascii=False)
+        return _dumps(av_data)
     
     # Both failed
-    return json.dumps({
+    return _dumps({
         "symbol": symbol,
         "error": "Failed to get company info from both FMP and Alpha Vantage",
         "fmp_error": fmp_data.get("error"),
         "av_error": av_data.get("error")
     })
 
+# ----------------------------
+# Batch Tools
+# ----------------------------
+
+# fmp_batch endpoint name -> tool taking the ticker as its only required argument
+FMP_BATCH_ENDPOINTS = {
+    "profile": fmp_get_profile,
+    "quote": fmp_quote,
+    "financials": fmp_get_financials,
+    "key_metrics": fmp_get_key_metrics,
+    "ratios": fmp_get_ratios,
+    "historical": fmp_get_historical_prices,
+    "estimates": fmp_get_analyst_estimates,
+    "insider": fmp_get_insider_trading,
+    "institutional": fmp_get_institutional_holders,
+    "sec": fmp_get_sec_filings,
+    "earnings": fmp_get_earnings_calendar,
+}
+
+# Endpoints stored under another data type, with the stored value taken from the tool
+# response; "historical" matches what fmp_get_historical_prices(guid=...) stores
+FMP_BATCH_DATA_TYPES = {
+    "historical": ("prices", lambda data: data.get("historical", [])),
+}
+
+# Endpoints whose payloads are large; with a guid they come back as storage summaries
+FMP_BATCH_BULK = frozenset({"historical", "insider", "institutional", "sec"})
+
+@mcp.tool()
+async def fmp_batch(ticker: str, endpoints: Optional[List[str]] = None, guid: Optional[str] = None) -> str:
+    """
+    Fetch several FMP endpoints for one ticker concurrently.
+    
+    Args:
+        ticker: Stock ticker symbol
+        endpoints: Names from FMP_BATCH_ENDPOINTS, defaults to all of them
+        guid: If given, successful results are appended to the guid's financial data log
+              ("historical" is stored as "prices"), and the bulky endpoints in
+              FMP_BATCH_BULK are returned as summaries instead of inline data
+    """
+    names = endpoints or list(FMP_BATCH_ENDPOINTS)
+    unknown = [n for n in names if n not in FMP_BATCH_ENDPOINTS]
+    if unknown:
+        return _dumps({"error": f"Unknown endpoints: {unknown}", "available": list(FMP_BATCH_ENDPOINTS)})
+
+    # The fmp_* tools are blocking, so each one runs in a worker thread
+    raw = await asyncio.gather(*(asyncio.to_thread(FMP_BATCH_ENDPOINTS[n], ticker) for n in names))
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name, payload in zip(names, raw):
+        try:
+            data = _loads(payload)
+        except ValueError as e:
+            errors[name] = str(e)
+            continue
+        if isinstance(data, dict) and "error" in data:
+            errors[name] = str(data["error"])
+            continue
+        results[name] = data
+
+    storage_path = None
+    if guid and results:
+        records: Dict[str, Any] = {}
+        for name, data in results.items():
+            data_type, extract = FMP_BATCH_DATA_TYPES.get(name, (name, None))
+            records[data_type] = extract(data) if extract is not None else data
+        try:
+            storage_path = str(_append_financial_data(guid, records))
+        except Exception as e:
+            errors["storage"] = str(e)
+        else:
+            # Stored bulk data is not echoed back through the MCP transport
+            for name in FMP_BATCH_BULK.intersection(results):
+                data_type = FMP_BATCH_DATA_TYPES.get(name, (name,))[0]
+                stored = records[data_type]
+                results[name] = {
+                    "data_type": data_type,
+                    "items": len(stored) if isinstance(stored, (list, dict)) else 1,
+                }
+
+    return _dumps({
+        "ticker": _sym(ticker),
+        "results": results,
+        "errors": errors,
+        "storage_path": storage_path,
+    })
+
+@mcp.tool()
+@_cached(ttl=TTL_QUOTE)
+def fmp_quotes_batch(symbols: str, force_refresh: bool = False) -> str:
+    """
+    Get real-time quotes for several symbols in a single FMP request.
+    Cached for 60 seconds; force_refresh=True bypasses the cache.
+    """
+    api_key = _fmp_key()
+    if not api_key:
+        return _dumps({"symbols": [], "quotes": {}, "error": "FMP_API_KEY not set"})
+
+    sym_list = _normalize_symbols(symbols)
+    if not sym_list:
+        return _dumps({"error": "No symbols provided"})
+
+    # The batch endpoint takes a comma-separated list, so N quotes cost one round trip
+    url = f"{FMP_BASE_URL}/stable/batch-quote"
+    params = {"symbols": ",".join(sym_list), "apikey": api_key}
+
+    try:
+        r = _HTTP.get(url, params=params, timeout=20)
+        r.raise_for_status()
+        data = _loads(r.content)
+
+        quotes: Dict[str, Any] = {}
+        for q in data if isinstance(data, list) else []:
+            if isinstance(q, dict) and q.get("symbol"):
+                quotes[str(q["symbol"]).upper()] = _quote_fields(q)
+
+        return _dumps({
+            "symbols": sym_list,
+            "quotes": quotes,
+            "missing": [s for s in sym_list if s not in quotes],
+        })
+    except Exception as e:
+        return _dumps({"symbols": sym_list, "error": str(e)})
+
+@mcp.tool()
+async def fmp_get_profiles_batch(symbols: str) -> str:
+    """
+    Get company profiles for several symbols concurrently.
+    FMP has no multi-symbol profile endpoint, so each symbol is one cached fmp_get_profile call.
+    """
+    sym_list = _normalize_symbols(symbols)
+    if not sym_list:
+        return _dumps({"error": "No symbols provided"})
+
+    raw = await asyncio.gather(*(asyncio.to_thread(fmp_get_profile, s) for s in sym_list))
+
+    profiles: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for sym, payload in zip(sym_list, raw):
+        try:
+            data = _loads(payload)
+        except ValueError as e:
+            errors[sym] = str(e)
+            continue
+        if isinstance(data, dict) and "error" in data:
+            errors[sym] = str(data["error"])
+            continue
+        profiles[sym] = data
+
+    return _dumps({"symbols": sym_list, "profiles": profiles, "errors": errors})
+
 if __name__ == "__main__":
     mcp.run()